@@ -44,6 +44,8 @@ class ToggleableMultiChannelPlayback:
 
     Attributes:
         channel_enabled (list): Boolean flags for music channels (left)
+        channel_enabled_mask (int): Same flags as a bitmask (bit i = channel i),
+            readable from other threads in one atomic load
         active_count (int): Number of currently active music channels
         lock (threading.RLock): Reentrant lock for thread-safe state changes
     """
@@ -76,6 +78,7 @@ class ToggleableMultiChannelPlayback:
 
         # Initialize all music channels as disabled
         self.channel_enabled = [False] * len(devices)
+        self.channel_enabled_mask = 0
         self.active_count = 0
 
         # Whether to loop audio playback
@@ -375,11 +378,13 @@ class ToggleableMultiChannelPlayback:
             # Enable all channels for dormant mode
             for i in range(len(self.channel_enabled)):
                 self.channel_enabled[i] = True
+            self.channel_enabled_mask = (1 << len(self.channel_enabled)) - 1
             self.active_count = len(self.channel_enabled)
         else:
             # Disable all channels (will be selectively enabled for active statues)
             for i in range(len(self.channel_enabled)):
                 self.channel_enabled[i] = False
+            self.channel_enabled_mask = 0
             self.active_count = 0
 
         if self.debug:
@@ -404,6 +409,10 @@ class ToggleableMultiChannelPlayback:
 
         # with self.lock:
         self.channel_enabled[channel_index] = enabled
+        if enabled:
+            self.channel_enabled_mask |= 1 << channel_index
+        else:
+            self.channel_enabled_mask &= ~(1 << channel_index)
 
         # Update active count
         self.active_count = sum(self.channel_enabled)
@@ -420,6 +429,63 @@ class ToggleableMultiChannelPlayback:
                 self.frame_index = 0  # Reset if at end
         return True
 
+    def apply_channel_states(self, states: list[tuple[int, bool]]) -> bool:
+        """Set several music channels in one step.
+
+        Equivalent to calling set_music_channel for each pair in order,
+        including the playback stop/restart when the running active count
+        touches zero partway through, but the count is kept incrementally
+        instead of being re-summed per pair.
+
+        Args:
+            states (list): (channel_index, enabled) pairs
+
+        Returns:
+            bool: True if every index was valid; invalid pairs are skipped
+
+        Example:
+            >>> devices = [{"device_index": 0}, {"device_index": 0}]
+            >>> player = ToggleableMultiChannelPlayback(np.zeros((1000, 2)), 48000, devices)
+            >>> player.apply_channel_states([(0, True)])
+            True
+            >>> player.frame_index = 500
+            >>> player.apply_channel_states([(0, False), (1, True)])  # Off, then on
+            True
+            >>> player.frame_index, player.is_stopped, player.active_count
+            (0, False, 1)
+        """
+        all_valid = True
+        active_count = sum(self.channel_enabled)
+        for channel_index, enabled in states:
+            if channel_index < 0 or channel_index >= len(self.channel_enabled):
+                all_valid = False
+                continue
+            if self.debug:
+                print(
+                    f"Setting channel {channel_index} to {'enabled' if enabled else 'disabled'}"
+                )
+            if self.channel_enabled[channel_index] != enabled:
+                active_count += 1 if enabled else -1
+            self.channel_enabled[channel_index] = enabled
+            if enabled:
+                self.channel_enabled_mask |= 1 << channel_index
+            else:
+                self.channel_enabled_mask &= ~(1 << channel_index)
+
+            # Same playback transitions as set_music_channel, per pair
+            if active_count == 0 and not self.is_stopped:
+                # Last channel turned off - stop playback
+                self.is_stopped = True
+                self.frame_index = 0  # Reset to beginning
+            elif active_count == 1 and self.is_stopped and enabled:
+                # First channel turned on - start playback
+                self.is_stopped = False
+                if self.frame_index >= len(self.audio_data):
+                    self.frame_index = 0  # Reset if at end
+
+        self.active_count = active_count
+        return all_valid
+
     def set_broadcast_mode(self, enabled: bool):
         """Enable or disable broadcast mode.
 
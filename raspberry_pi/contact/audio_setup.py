@@ -93,9 +93,13 @@ class DynamicToneGenerator:
             return self.frequency
 
     def __call__(self, frames):
-        """Generate tone samples using the working generator."""
-        with self.lock:
-            return self.base_generator(frames)
+        """Generate tone samples using the working generator.
+
+        Runs on the audio callback thread without taking the lock: rebinding
+        base_generator is atomic, so a callback sees either the old or the
+        new generator, and either produces a valid block.
+        """
+        return self.base_generator(frames)
 
 
 def initialize_audio_playback(
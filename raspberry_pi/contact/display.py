@@ -35,7 +35,9 @@ Example Display:
     SOPHIA      │   0.000    0.001     ---
 """
 
+import io
 import json
+import os
 import select
 import sys
 import termios
@@ -44,6 +46,7 @@ import time
 import tty
 from typing import TYPE_CHECKING, Any, Optional
 
+import numpy as np
 import ultraimport as ui
 
 Statue = ui.ultraimport("__dir__/../audio/devices.py", "Statue")
@@ -58,6 +61,17 @@ except ImportError:
 if TYPE_CHECKING:
     from .link_state import LinkStateTracker
 
+# Terminal control sequences
+ENTER_SESSION = "\033[?1049h\033[?25l\033[2J\033[H"  # Alt screen, hide cursor, clear, home
+EXIT_SESSION = "\033[?25h\033[?1049l"  # Show cursor, leave alt screen
+CLEAR_SCREEN = "\033[2J\033[H"
+CURSOR_HOME = "\033[H"
+
+# Cell templates indexed by signal band: NO SIGNAL, WEAK, LINKED
+CELL_TEMPLATES = (" {:^5} ", "┌{:^5}┐", "╔{:^5}╗")
+# Upper bound on cached cell strings before the cache is reset
+CELL_CACHE_SIZE = 256
+
 
 class StatusDisplay:
     """Terminal-based status display for tone detection.
@@ -74,7 +88,8 @@ class StatusDisplay:
     Attributes:
         link_tracker (LinkStateTracker): Provides connection state info
         devices (list): Device configurations for all statues
-        detection_metrics (dict): 2D dictionary of signal levels
+        level_matrix (np.ndarray): Signal levels indexed [detector, target]
+        snr_matrix (np.ndarray): SNR values in dB indexed [detector, target]
         running (bool): Controls the display update loop
     """
 
@@ -94,8 +109,10 @@ class StatusDisplay:
         self.freq_controller = freq_controller
         self.mqtt_mode = mqtt_mode
         self.running = True
-        # 2D metrics: {detector_statue: {target_statue: {'level': float, 'snr': float}}}
-        self.detection_metrics = {}
+        # Dense metrics matrices: row = detector, column = target, in device order
+        self._idx = {d['statue']: i for i, d in enumerate(devices)}
+        self.level_matrix = np.zeros((len(devices), len(devices)))
+        self.snr_matrix = np.zeros((len(devices), len(devices)))
         # Track last update timestamp per detector
         self.last_update: dict[Statue, float] = {}
         # Track threshold per statue (from MQTT config messages)
@@ -105,7 +122,22 @@ class StatusDisplay:
         self.climax_connected_pairs: list = []
         self.climax_missing_pairs: list = []
         self.lock = threading.Lock()
-        self.first_draw = True
+        # Frame buffer so each redraw is a single terminal write
+        self._out = io.StringIO()
+        # Rendered cells keyed by (level in thousandths, band)
+        self._cell_cache: dict[tuple[int, int], str] = {}
+        # Matrix chrome that never changes after construction
+        self._row_labels = [f"  {d['statue'].value.upper():11s} │" for d in devices]
+        self._matrix_rule = "  ───────────────" + "─" * (len(devices) * 11) + "\r\n"
+        # Column headers are only static without a frequency controller
+        self._matrix_header = None if freq_controller else self._build_matrix_header()
+        # Legend is rebuilt only when the touch threshold changes
+        self._legend_threshold: Optional[float] = None
+        self._legend = ""
+        # Rendered all-zero matrix, keyed by the threshold it was drawn with
+        self._idle_matrix_block: Optional[tuple[float, str]] = None
+        # Bumped (under the lock) whenever displayed metrics or state change
+        self._version = 0
 
         # Logging support
         self.log_file = log_file
@@ -123,19 +155,8 @@ class StatusDisplay:
             if self.replay_data:
                 self.restore_snapshot(self.replay_data[0])
 
-        # Initialize 2D metrics for all statue pairs
         for detector_device in devices:
-            detector = detector_device['statue']
-            self.detection_metrics[detector] = {}
-            self.last_update[detector] = 0.0
-            for target_device in devices:
-                target = target_device['statue']
-                if detector != target:  # Can't detect self
-                    self.detection_metrics[detector][target] = {
-                        'level': 0.0,
-                        'snr': 0.0,
-                        'freq': TONE_FREQUENCIES.get(target, 0)
-                    }
+            self.last_update[detector_device['statue']] = 0.0
 
     def update_metrics(self, detector: Statue, target: Statue, level: float, snr: Optional[float] = None) -> None:
         """Update detection metrics for a detector-target pair.
@@ -149,12 +170,17 @@ class StatusDisplay:
             level (float): Signal level (0.0-1.0)
             snr (float, optional): Signal-to-noise ratio in dB
         """
+        i = self._idx.get(detector)
+        j = self._idx.get(target)
+        if i is None or j is None or i == j:
+            return
+
         with self.lock:
-            if detector in self.detection_metrics and target in self.detection_metrics[detector]:
-                metrics = self.detection_metrics[detector][target]
-                metrics['level'] = level
-                if snr is not None:
-                    metrics['snr'] = snr
+            if self.level_matrix[i, j] != level:
+                self.level_matrix[i, j] = level
+                self._version += 1
+            if snr is not None:
+                self.snr_matrix[i, j] = snr
 
     def update_detector_timestamp(self, detector: Statue) -> None:
         """Update the last update timestamp for a detector.
@@ -167,6 +193,7 @@ class StatusDisplay:
         """
         with self.lock:
             self.last_update[detector] = time.time()
+            self._version += 1
 
     def update_threshold(self, statue: Statue, threshold: float) -> None:
         """Update the detection threshold for a statue.
@@ -179,6 +206,7 @@ class StatusDisplay:
         """
         with self.lock:
             self.thresholds[statue] = threshold
+            self._version += 1
 
     def update_climax_state(self, state: str, connected_pairs: list, missing_pairs: list) -> None:
         """Update the climax state.
@@ -194,6 +222,7 @@ class StatusDisplay:
             self.climax_state = state
             self.climax_connected_pairs = connected_pairs
             self.climax_missing_pairs = missing_pairs
+            self._version += 1
 
     def capture_snapshot(self) -> dict:
         """Capture current state as a serializable snapshot.
@@ -202,12 +231,17 @@ class StatusDisplay:
             dict: Complete state snapshot with timestamp
         """
         with self.lock:
-            # Convert detection_metrics to serializable format
+            # Convert metrics matrices to serializable format
             metrics_serializable = {}
-            for detector, targets in self.detection_metrics.items():
+            for detector, i in self._idx.items():
                 metrics_serializable[detector.value] = {}
-                for target, metrics in targets.items():
-                    metrics_serializable[detector.value][target.value] = metrics.copy()
+                for target, j in self._idx.items():
+                    if i != j:
+                        metrics_serializable[detector.value][target.value] = {
+                            'level': float(self.level_matrix[i, j]),
+                            'snr': float(self.snr_matrix[i, j]),
+                            'freq': TONE_FREQUENCIES.get(target, 0),
+                        }
 
             # Convert links to serializable format
             links_serializable = {}
@@ -251,29 +285,28 @@ class StatusDisplay:
             snapshot (dict): Snapshot to restore from
         """
         with self.lock:
-            # Restore detection_metrics
-            self.detection_metrics = {}
+            # Restore metrics matrices
+            self.level_matrix.fill(0.0)
+            self.snr_matrix.fill(0.0)
             for detector_str, targets in snapshot.get('detection_metrics', {}).items():
-                detector = Statue(detector_str)
-                self.detection_metrics[detector] = {}
+                i = self._idx.get(Statue(detector_str))
+                if i is None:
+                    continue
                 for target_str, metrics in targets.items():
-                    target = Statue(target_str)
-                    self.detection_metrics[detector][target] = metrics.copy()
+                    j = self._idx.get(Statue(target_str))
+                    if j is None or i == j:
+                        continue
+                    self.level_matrix[i, j] = metrics.get('level', 0.0)
+                    self.snr_matrix[i, j] = metrics.get('snr', 0.0)
 
             # Restore links
             links_dict = {}
             for statue_str, linked_list in snapshot.get('links', {}).items():
                 statue = Statue(statue_str)
                 links_dict[statue] = set(Statue(s) for s in linked_list)
+            # has_links is derived from links, so it needs no separate restore
             self.link_tracker.links = links_dict
 
-            # Restore has_links
-            has_links_dict = {}
-            for statue_str, has_link in snapshot.get('has_links', {}).items():
-                statue = Statue(statue_str)
-                has_links_dict[statue] = has_link
-            self.link_tracker.has_links = has_links_dict
-
             # Restore last_update
             self.last_update = {}
             for statue_str, timestamp in snapshot.get('last_update', {}).items():
@@ -290,6 +323,7 @@ class StatusDisplay:
             self.climax_state = snapshot.get('climax_state', 'inactive')
             self.climax_connected_pairs = snapshot.get('climax_connected_pairs', [])
             self.climax_missing_pairs = snapshot.get('climax_missing_pairs', [])
+            self._version += 1
 
     def load_replay_data(self, file_path: str) -> None:
         """Load replay data from JSONL file.
@@ -364,7 +398,6 @@ class StatusDisplay:
 
         if changed:
             self.restore_snapshot(self.replay_data[self.replay_index])
-            self.first_draw = True  # Force redraw
 
     def format_cell(self, level: float, is_self: bool = False, threshold: Optional[float] = None) -> str:
         """Format a single cell with level and box indicators.
@@ -384,159 +417,192 @@ class StatusDisplay:
         if threshold is None:
             threshold = dynConfig["touch_threshold"]
 
-        level_str = f"{level:.3f}"
-
         if level > threshold:
-            # LINKED - double box around value
-            return f"╔{level_str:^5}╗"
+            band = 2  # LINKED - double box around value
         elif level > threshold * 0.5:
-            # WEAK - single box around value
-            return f"┌{level_str:^5}┐"
+            band = 1  # WEAK - single box around value
         else:
-            # NO SIGNAL - just value
-            return f" {level_str:^5} "
+            band = 0  # NO SIGNAL - just value
+
+        try:
+            milli = round(level * 1000)
+        except (ValueError, OverflowError):
+            # NaN/inf levels can't be quantized; format them directly
+            return CELL_TEMPLATES[band].format(f"{level:.3f}")
+
+        # Levels are quasi-stationary, so most cells are cache hits
+        key = (milli, band)
+        cell = self._cell_cache.get(key)
+        if cell is None:
+            if len(self._cell_cache) >= CELL_CACHE_SIZE:
+                self._cell_cache.clear()
+            cell = CELL_TEMPLATES[band].format(f"{milli / 1000:.3f}")
+            self._cell_cache[key] = cell
+        return cell
+
+    def _begin_frame(self) -> io.StringIO:
+        """Return the frame buffer emptied of any partially drawn frame."""
+        # Reuse the same buffer across frames rather than reallocating it
+        self._out.seek(0)
+        self._out.truncate(0)
+        return self._out
+
+    def _write_terminal(self, text: str) -> None:
+        """Write text to the terminal with a single syscall."""
+        sys.stdout.flush()
+        view = memoryview(text.encode())
+        while view:
+            view = view[os.write(sys.stdout.fileno(), view):]
+
+    def _flush_frame(self) -> None:
+        """Write the buffered frame to the terminal."""
+        self._write_terminal(self._out.getvalue())
+
+    def _build_matrix_header(self) -> str:
+        """Build the detection matrix column headers.
+
+        Returns:
+            str: Statue name and frequency header lines
+        """
+        # Header row with statue names and frequencies
+        # Row label format is: "  {detector.value.upper():11s} │" = 16 chars total
+        header_line1 = "  DETECTOR    │"  # Match the row label format
+        header_line2 = "  (Listening) │"  # Match the row label format
+
+        for d in self.devices:
+            statue = d['statue']
+            name = statue.value.upper()
+
+            # Use dynamic frequency if frequency controller is available
+            if self.freq_controller:
+                freq = self.freq_controller.get_current_frequency(statue)
+                # Mark selected statue with arrow
+                if statue == self.freq_controller.get_selected_statue():
+                    name = f"→{name}←"
+                # Show muted status
+                if self.freq_controller.is_muted(statue):
+                    freq_str = "MUTED"
+                else:
+                    freq_str = f"{freq:.0f}"
+            else:
+                freq = TONE_FREQUENCIES.get(statue, 0)
+                freq_str = f"{freq:.0f}"
+
+            # Each cell is centered in 9 chars
+            header_line1 += f"  {name:^7}  "
+            header_line2 += f"  {freq_str:^7}  "
 
-    def clear_screen(self) -> None:
-        """Clear terminal screen."""
-        print("\033[2J\033[H", end='', flush=True)
+        return header_line1 + "\r\n" + header_line2 + "Hz\r\n"
 
-    def hide_cursor(self):
-        """Hide terminal cursor."""
-        print("\033[?25l", end='', flush=True)
+    def _render_matrix_rows(self, levels: np.ndarray) -> str:
+        """Render the detection matrix body.
 
-    def show_cursor(self):
-        """Show terminal cursor."""
-        print("\033[?25h", end='', flush=True)
+        Args:
+            levels: Snapshot of level_matrix indexed [detector, target]
+
+        Returns:
+            str: One padded line per detector
+        """
+        rows = []
+        # For each detector (row)
+        for i, row_label in enumerate(self._row_labels):
+            # Row label - ensure consistent spacing
+            row_line = row_label
+
+            # For each target/transmitter (column)
+            for j in range(len(self.devices)):
+                if i == j:
+                    # Self-detection
+                    cell = self.format_cell(0, is_self=True)
+                else:
+                    cell = self.format_cell(levels[i, j])
 
-    def enter_alt_screen(self):
-        """Enter alternate screen buffer."""
-        print("\033[?1049h", end='', flush=True)
+                # Add cell to row with spacing
+                row_line += f"  {cell}  "
 
-    def exit_alt_screen(self):
-        """Exit alternate screen buffer."""
-        print("\033[?1049l", end='', flush=True)
+            # Print the row with padding to ensure clean overwrites
+            rows.append(f"{row_line:<100}\r\n")
 
-    def move_cursor_home(self):
-        """Move cursor to home position without clearing."""
-        print("\033[H", end='', flush=True)
+        return "".join(rows)
 
     def draw_interface(self) -> None:
         """Draw the status interface."""
-        if self.first_draw:
-            self.clear_screen()
-            self.first_draw = False
-        else:
-            self.move_cursor_home()
+        # The screen was cleared at session start; rows are padded so
+        # redrawing from the home position overwrites the previous frame
+        out = self._begin_frame()
+        out.write(CURSOR_HOME)
 
         # Header
-        print("=== Missing Link Tone Detection ===\r\n\r", flush=True)
+        out.write("=== Missing Link Tone Detection ===\r\n\r\n")
 
         # Connection Status
-        print("CONNECTION STATUS:\r", flush=True)
+        out.write("CONNECTION STATUS:\r\n")
+        links = self.link_tracker.get_detector_emitters()
+        has_links = self.link_tracker.has_links
         for device in self.devices:
             statue = device['statue']
-            is_linked = self.link_tracker.has_links[statue]
+            is_linked = has_links[statue]
             status = "ON " if is_linked else "OFF"
             bar = "█" * 12 if is_linked else "─" * 12
 
             # Get linked statues
             linked_to = []
             if is_linked:
-                linked_to = [s.value for s in self.link_tracker.links[statue]]
+                linked_to = [s.value for s in links[statue]]
             linked_str = " ↔ " + ", ".join(linked_to) if linked_to else " Not linked"
 
             # Pad the line to ensure we overwrite any previous content
             line = f"{statue.value:8s} [{status}] {bar} {linked_str}"
-            print(f"{line:<80}\r", flush=True)  # Pad to 80 chars
+            out.write(f"{line:<80}\r\n")  # Pad to 80 chars
 
         # Audio Status
-        print("\r\nAUDIO STATUS:\r", flush=True)
+        out.write("\r\nAUDIO STATUS:\r\n")
         if self.link_tracker.playback:
             progress = self.link_tracker.playback.get_progress()
             active = self.link_tracker.playback.active_count
             total = len(self.devices)
             playing = "Playing" if self.link_tracker.playback.is_playing else "Stopped"
-            print(f"Playback: {playing} ({progress}%)  |  Active channels: {active}/{total}\r", flush=True)
+            out.write(f"Playback: {playing} ({progress}%)  |  Active channels: {active}/{total}\r\n")
         else:
-            print("Playback: No audio loaded\r", flush=True)
+            out.write("Playback: No audio loaded\r\n")
 
         # Tone Detection Matrix
-        print("\r\nTONE DETECTION MATRIX:\r", flush=True)
-        print("                    TRANSMITTER (Playing Tone)\r", flush=True)
+        out.write("\r\nTONE DETECTION MATRIX:\r\n")
+        out.write("                    TRANSMITTER (Playing Tone)\r\n")
 
-        # Header row with statue names and frequencies
-        # Row label format is: "  {detector.value.upper():11s} │" = 16 chars total
-        header_line1 = "  DETECTOR    │"  # Match the row label format
-        header_line2 = "  (Listening) │"  # Match the row label format
-
-        for d in self.devices:
-            statue = d['statue']
-            name = statue.value.upper()
-
-            # Use dynamic frequency if frequency controller is available
-            if self.freq_controller:
-                freq = self.freq_controller.get_current_frequency(statue)
-                # Mark selected statue with arrow
-                if statue == self.freq_controller.get_selected_statue():
-                    name = f"→{name}←"
-                # Show muted status
-                if self.freq_controller.is_muted(statue):
-                    freq_str = "MUTED"
-                else:
-                    freq_str = f"{freq:.0f}"
-            else:
-                freq = TONE_FREQUENCIES.get(statue, 0)
-                freq_str = f"{freq:.0f}"
-
-            # Each cell is centered in 9 chars
-            header_line1 += f"  {name:^7}  "
-            header_line2 += f"  {freq_str:^7}  "
-
-        print(header_line1 + "\r", flush=True)
-        print(header_line2 + "Hz\r", flush=True)
-        print("  ───────────────" + "─" * (len(self.devices) * 11) + "\r", flush=True)
+        out.write(self._matrix_header or self._build_matrix_header())
+        out.write(self._matrix_rule)
 
+        # Copy the levels under the lock and format outside it, so detection
+        # threads are never blocked behind the rendering
         with self.lock:
-            # For each detector (row)
-            for detector_device in self.devices:
-                detector = detector_device['statue']
-
-                # Row label - ensure consistent spacing
-                row_label = f"  {detector.value.upper():11s} │"
-                row_line = row_label
-
-                # For each target/transmitter (column)
-                for target_device in self.devices:
-                    target = target_device['statue']
-
-                    if detector == target:
-                        # Self-detection
-                        cell = self.format_cell(0, is_self=True)
-                    else:
-                        # Get detection level
-                        level = 0.0
-                        if detector in self.detection_metrics and target in self.detection_metrics[detector]:
-                            level = self.detection_metrics[detector][target]['level']
-                        cell = self.format_cell(level)
-
-                    # Add cell to row with spacing
-                    row_line += f"  {cell}  "
-
-                # Print the row with padding to ensure clean overwrites
-                print(f"{row_line:<100}\r", flush=True)
+            levels = self.level_matrix.copy()
+
+        if levels.any():
+            out.write(self._render_matrix_rows(levels))
+        else:
+            # Idle matrix renders identically every frame until the threshold changes
+            threshold = dynConfig["touch_threshold"]
+            if self._idle_matrix_block is None or self._idle_matrix_block[0] != threshold:
+                self._idle_matrix_block = (threshold, self._render_matrix_rows(levels))
+            out.write(self._idle_matrix_block[1])
 
         # Legend
         threshold = dynConfig["touch_threshold"]
-        print(f"\r\nLegend: ╔═╗ LINKED (>{threshold:.2f})  "
-              f"┌─┐ WEAK (>{threshold*0.5:.2f})  "
-              f"Plain text: NO SIGNAL (<{threshold*0.5:.2f})\r", flush=True)
+        if threshold != self._legend_threshold:
+            self._legend_threshold = threshold
+            self._legend = (f"\r\nLegend: ╔═╗ LINKED (>{threshold:.2f})  "
+                            f"┌─┐ WEAK (>{threshold*0.5:.2f})  "
+                            f"Plain text: NO SIGNAL (<{threshold*0.5:.2f})\r\n")
+        out.write(self._legend)
 
         if self.freq_controller:
-            print("\r\nInteractive Controls: A/D=Navigate statues | W/S=Adjust frequency (±500Hz) | Space=Mute/Unmute | Q=Quit\r", flush=True)
+            out.write("\r\nInteractive Controls: A/D/←/→=Navigate statues | W/S/↑/↓=Adjust frequency (±500Hz) | Space=Mute/Unmute | Q=Quit\r\n")
         else:
-            print("\r\nPress Ctrl+C to stop\r", flush=True)
+            out.write("\r\nPress Ctrl+C to stop\r\n")
         # Add some blank lines to ensure we overwrite any previous content
-        print("\r\n" * 3, end='', flush=True)
+        out.write("\r\n" * 3)
+        self._flush_frame()
 
     def draw_mqtt_interface(self) -> None:
         """Draw the MQTT-optimized status interface.
@@ -544,12 +610,13 @@ class StatusDisplay:
         Shows detector → emitters in a simple table format with timestamps
         and placeholders for future level/SNR data.
         """
-        # Always clear screen to prevent smearing
-        self.clear_screen()
+        out = self._begin_frame()
+        # Always clear screen to prevent smearing (rows are not padded)
+        out.write(CLEAR_SCREEN)
 
         # Header
         if self.replay_mode:
-            print("=== Missing Link MQTT Status Monitor - REPLAY MODE ===\n", end='', flush=True)
+            out.write("=== Missing Link MQTT Status Monitor - REPLAY MODE ===\n")
             # Show replay position and timestamp
             if self.replay_data:
                 current_snapshot = self.replay_data[self.replay_index]
@@ -557,11 +624,11 @@ class StatusDisplay:
                 import datetime
                 dt = datetime.datetime.fromtimestamp(timestamp)
                 timestamp_str = dt.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-                print(f"Frame {self.replay_index + 1}/{len(self.replay_data)} - {timestamp_str}\n", end='', flush=True)
-                print("Controls: j/← Prev | l/→ Next | h/Home Start | ;/End End | 0-9 Jump % | q Quit\n", end='', flush=True)
+                out.write(f"Frame {self.replay_index + 1}/{len(self.replay_data)} - {timestamp_str}\n")
+                out.write("Controls: j/← Prev | l/→ Next | h/Home Start | ;/End End | 0-9 Jump % | q Quit\n")
         else:
-            print("=== Missing Link MQTT Status Monitor ===\n", end='', flush=True)
-        print("\n", end='', flush=True)  # Blank line
+            out.write("=== Missing Link MQTT Status Monitor ===\n")
+        out.write("\n")  # Blank line
 
         # Climax status section
         with self.lock:
@@ -570,19 +637,20 @@ class StatusDisplay:
 
             if self.climax_state == "active":
                 # Show active climax
-                print(f"{climax_indicator} {climax_label}: ACTIVE\n", end='', flush=True)
+                out.write(f"{climax_indicator} {climax_label}: ACTIVE\n")
             else:
                 # Show inactive climax with missing pairs
                 if self.climax_missing_pairs:
                     missing_str = ", ".join([f"{p[0]}↔{p[1]}" for p in self.climax_missing_pairs])
-                    print(f"{climax_indicator} {climax_label}: INACTIVE - Missing: {missing_str}\n", end='', flush=True)
+                    out.write(f"{climax_indicator} {climax_label}: INACTIVE - Missing: {missing_str}\n")
                 else:
-                    print(f"{climax_indicator} {climax_label}: INACTIVE\n", end='', flush=True)
+                    out.write(f"{climax_indicator} {climax_label}: INACTIVE\n")
 
-        print("\n", end='', flush=True)  # Blank line after climax status
+        out.write("\n")  # Blank line after climax status
 
         # Get current detector→emitters mapping from link tracker
         detector_emitters = self.link_tracker.get_detector_emitters()
+        has_links = self.link_tracker.has_links
 
         # Build table header with column for each statue
         header = f"{'DETECTOR':<10} {'EMITTERS':<20} {'UPDATE':<10}"
@@ -590,83 +658,100 @@ class StatusDisplay:
             statue = device['statue']
             header += f" {statue.value.upper():<7}"
         header += f" {'THRESHOLD':<9}"
-        print(header + "\n", end='', flush=True)
-        print("─" * len(header) + "\n", end='', flush=True)
+        out.write(header + "\n")
+        out.write("─" * len(header) + "\n")
 
         current_time = time.time()
+        # Copy shared state under the lock and format outside it
         with self.lock:
-            # Display each detector's state
-            for device in self.devices:
-                detector = device['statue']
-                emitters = detector_emitters.get(detector, [])
-
-                # Format emitters list
-                if emitters:
-                    emitters_str = ",".join([e.value for e in emitters])
-                else:
-                    emitters_str = "(none)"
+            levels = self.level_matrix.copy()
+            thresholds = dict(self.thresholds)
+            last_update = dict(self.last_update)
+
+        # Display each detector's state
+        for i, device in enumerate(self.devices):
+            detector = device['statue']
+            emitters = detector_emitters.get(detector, [])
+
+            # Format emitters list
+            if emitters:
+                emitters_str = ",".join([e.value for e in emitters])
+            else:
+                emitters_str = "(none)"
 
-                # Status indicator based on has_links (includes both outgoing and incoming)
-                status_indicator = "●" if self.link_tracker.has_links[detector] else "○"
+            # Status indicator based on has_links (includes both outgoing and incoming)
+            status_indicator = "●" if has_links[detector] else "○"
 
-                # Format last update time (shortened)
-                last_update_time = self.last_update.get(detector, 0.0)
-                if last_update_time == 0.0:
-                    update_str = "Never"
+            # Format last update time (shortened)
+            last_update_time = last_update.get(detector, 0.0)
+            if last_update_time == 0.0:
+                update_str = "Never"
+            else:
+                elapsed = current_time - last_update_time
+                if elapsed < 60:
+                    update_str = f"{elapsed:.1f}s"
+                elif elapsed < 3600:
+                    update_str = f"{elapsed/60:.1f}m"
                 else:
-                    elapsed = current_time - last_update_time
-                    if elapsed < 60:
-                        update_str = f"{elapsed:.1f}s"
-                    elif elapsed < 3600:
-                        update_str = f"{elapsed/60:.1f}m"
-                    else:
-                        update_str = f"{elapsed/3600:.1f}h"
-
-                # Build row starting with detector, emitters, update
-                line = f"{status_indicator} {detector.value:<8} {emitters_str:<20} {update_str:<10}"
-
-                # Add level column for each emitter statue
-                for emitter_device in self.devices:
-                    emitter = emitter_device['statue']
-
-                    if detector == emitter:
-                        # Can't detect self
-                        cell = self.format_cell(0.0, is_self=True)
-                    else:
-                        # Get level from detection metrics
-                        level = 0.0
-                        if detector in self.detection_metrics and emitter in self.detection_metrics[detector]:
-                            level = self.detection_metrics[detector][emitter]['level']
-
-                        # Use detector-specific threshold if available
-                        detector_threshold = self.thresholds.get(detector, None)
-                        cell = self.format_cell(level, is_self=False, threshold=detector_threshold)
-
-                    line += f" {cell}"
-
-                # Add threshold column
-                if detector in self.thresholds:
-                    threshold_str = f"{self.thresholds[detector]:.3f}"
+                    update_str = f"{elapsed/3600:.1f}h"
+
+            # Build row starting with detector, emitters, update
+            line = f"{status_indicator} {detector.value:<8} {emitters_str:<20} {update_str:<10}"
+
+            # Add level column for each emitter statue
+            detector_threshold = thresholds.get(detector)
+            for j in range(len(self.devices)):
+                if i == j:
+                    # Can't detect self
+                    cell = self.format_cell(0.0, is_self=True)
                 else:
-                    threshold_str = "[N/A]"
-                line += f" {threshold_str:<9}"
+                    # Use detector-specific threshold if available
+                    cell = self.format_cell(levels[i, j], is_self=False,
+                                            threshold=detector_threshold)
+
+                line += f" {cell}"
 
-                # Print row with padding
-                print(f"{line:<120}\n", end='', flush=True)
+            # Add threshold column
+            if detector in thresholds:
+                threshold_str = f"{thresholds[detector]:.3f}"
+            else:
+                threshold_str = "[N/A]"
+            line += f" {threshold_str:<9}"
+
+            # Print row with padding
+            out.write(f"{line:<120}\n")
 
         # Legend
-        print("\n", end='', flush=True)  # Blank line
-        print("Legend: ● = Linked  ○ = Unlinked  --- = Self-detection\n", end='', flush=True)
-        print("        ╔═╗ LINKED (>threshold)  ┌─┐ WEAK (>threshold×0.5)  Plain: NO SIGNAL\n", end='', flush=True)
-        print("Signal levels updated from missing_link/signals MQTT topic (published every 100ms)\n", end='', flush=True)
-        print("Box indicators based on per-detector threshold values shown in THRESHOLD column\n", end='', flush=True)
-        print("\n", end='', flush=True)  # Blank line
-        print("Press Ctrl+C to stop\n", end='', flush=True)
+        out.write("\n")  # Blank line
+        out.write("Legend: ● = Linked  ○ = Unlinked  --- = Self-detection\n")
+        out.write("        ╔═╗ LINKED (>threshold)  ┌─┐ WEAK (>threshold×0.5)  Plain: NO SIGNAL\n")
+        out.write("Signal levels updated from missing_link/signals MQTT topic (published every 100ms)\n")
+        out.write("Box indicators based on per-detector threshold values shown in THRESHOLD column\n")
+        out.write("\n")  # Blank line
+        out.write("Press Ctrl+C to stop\n")
+        self._flush_frame()
+
+    def _frame_key(self) -> Optional[tuple]:
+        """Return a value that changes whenever the next frame would differ.
+
+        Returns:
+            tuple or None: Comparable key for the detection view, or None for
+                the MQTT view, whose update ages change on every frame
+        """
+        if self.mqtt_mode:
+            return None
+        playback = self.link_tracker.playback
+        playback_state = ((playback.is_playing, playback.get_progress(), playback.active_count)
+                          if playback else None)
+        freq_state = ((self.freq_controller.get_selected_statue(),
+                       int(self.freq_controller.freq_generation[0]))
+                      if self.freq_controller else None)
+        return (self._version, self.link_tracker.get_version(), playback_state, freq_state,
+                dynConfig["touch_threshold"])
 
     def run(self) -> None:
         """Run the display update loop."""
-        self.enter_alt_screen()
-        self.hide_cursor()
+        self._write_terminal(ENTER_SESSION)
 
         # Set up raw terminal mode for replay keyboard input
         old_settings = None
@@ -675,17 +760,22 @@ class StatusDisplay:
             tty.setcbreak(sys.stdin.fileno())
 
         try:
+            # Key of the last frame drawn; a fresh object never compares equal
+            last_key: object = object()
             while self.running:
                 try:
                     # Handle replay navigation
                     if self.replay_mode:
                         self.handle_replay_navigation()
 
-                    # Draw interface
-                    if self.mqtt_mode:
-                        self.draw_mqtt_interface()
-                    else:
-                        self.draw_interface()
+                    # Draw interface, skipping frames identical to the last one
+                    key = self._frame_key()
+                    if key is None or key != last_key:
+                        last_key = key
+                        if self.mqtt_mode:
+                            self.draw_mqtt_interface()
+                        else:
+                            self.draw_interface()
 
                     # Log snapshot if logging enabled
                     if self.log_handle and not self.replay_mode:
@@ -705,8 +795,7 @@ class StatusDisplay:
                 self.log_handle.close()
 
             # Always clean up, even on exception
-            self.show_cursor()
-            self.exit_alt_screen()
+            self._write_terminal(EXIT_SESSION)
 
     def stop(self) -> None:
         """Stop the display."""
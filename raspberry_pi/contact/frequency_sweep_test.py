@@ -1,6 +1,6 @@
 #!/usr/bin/env -S uv run --script
 # /// script
-# dependencies = ["fastgoertzel", "numpy", "sounddevice", "soundfile", "matplotlib"]
+# dependencies = ["numba", "numpy", "scipy", "sounddevice", "soundfile", "matplotlib"]
 # ///
 
 """
@@ -9,12 +9,16 @@ Tests frequencies from 2kHz to 20kHz with emphasis on higher frequencies.
 Based on production experience showing 10kHz works well with long cables.
 """
 
+import math
+import queue
+import threading
 import time
 from collections import defaultdict
 from datetime import datetime
 
-import fastgoertzel as G
+import numba
 import numpy as np
+import scipy.fft
 import sounddevice as sd
 
 # Import device configuration from audio module
@@ -48,11 +52,97 @@ AMPLITUDE = 0.5
 SAMPLE_RATE = 48000  # Increased for better high frequency response
 BLOCK_SIZE = 1024
 DETECTION_THRESHOLD = 0.1
+ANALYSIS_CHUNK_BLOCKS = 8  # Blocks captured per read and analyzed as one batch
+ANALYSIS_QUEUE_SIZE = 8  # Captured chunks allowed to wait for the analysis thread
+
+# Column order of the per-sample metrics returned by analyze_signal()
+METRIC_FIELDS = ('goertzel_level', 'snr_db', 'frequency_error_percent',
+                 'cable_attenuation_estimate', 'peak_magnitude')
+
+# Frequency selection constraints
+BAD_RATIOS = np.array([1.25, 1.33, 1.5, 2.0, 3.0, 4.0, 5.0])  # Harmonic ratios to avoid
+HARMONIC_TOLERANCE = 0.05
+MIN_SEPARATION_RATIO = 1.2
 
 # Results storage
 test_results = defaultdict(dict)
 
 
+def harmonic_conflicts(freqs):
+    """Build the pairwise conflict table for a set of candidate frequencies.
+
+    Args:
+        freqs (np.ndarray): Candidate frequencies in Hz
+
+    Returns:
+        np.ndarray: Symmetric (N, N) bool matrix, True where two frequencies
+            are too close or harmonically related. The diagonal is True, so
+            selecting a frequency also rules out selecting it again.
+    """
+    ratios = np.maximum.outer(freqs, freqs) / np.minimum.outer(freqs, freqs)
+    harmonic = (np.abs(ratios[..., np.newaxis] - BAD_RATIOS) < HARMONIC_TOLERANCE).any(axis=-1)
+    return (ratios < MIN_SEPARATION_RATIO) | harmonic
+
+
+@numba.njit(cache=True, fastmath=True, nogil=True)
+def _window_stats(fft_data, start, end):
+    """Peak and noise power around the target bin for every block in one pass.
+
+    Args:
+        fft_data (np.ndarray): Complex spectra shaped (block_count, bin_count)
+        start: First bin of the signal window
+        end: One past the last bin of the signal window
+
+    Returns:
+        tuple: (peak_mag, peak_idx, noise_power) arrays, one entry per block
+    """
+    block_count, bin_count = fft_data.shape
+    noise_bins = bin_count - (end - start)
+    peak_mag = np.empty(block_count)
+    peak_idx = np.empty(block_count, dtype=np.int64)
+    noise_power = np.empty(block_count)
+
+    for b in range(block_count):
+        peak = -1.0
+        peak_i = start
+        noise_sq = 0.0
+        for i in range(bin_count):
+            m = abs(fft_data[b, i])
+            if start <= i < end:
+                if m > peak:
+                    peak = m
+                    peak_i = i
+            else:
+                noise_sq += m * m
+        peak_mag[b] = peak
+        peak_idx[b] = peak_i
+        noise_power[b] = noise_sq / noise_bins if noise_bins > 0 else 0.0
+
+    return peak_mag, peak_idx, noise_power
+
+
+@numba.njit(cache=True)
+def _oscillate(buf, frames, coeff, s1, s2):
+    """Fill buf[:frames] with a sine from the recurrence s[n] = coeff*s[n-1] - s[n-2].
+
+    Args:
+        buf (np.ndarray): Output buffer of at least `frames` samples
+        frames: Number of samples to generate
+        coeff: 2*cos(w) for the normalized angular frequency w
+        s1: Previous sample, s[n-1]
+        s2: Sample before that, s[n-2]
+
+    Returns:
+        tuple: Updated (s1, s2) so the next block continues the phase
+    """
+    for n in range(frames):
+        s = coeff * s1 - s2
+        buf[n] = AMPLITUDE * s
+        s2 = s1
+        s1 = s
+    return s1, s2
+
+
 class FrequencySweeper:
     """Performs frequency sweep testing with cable length considerations."""
 
@@ -61,14 +151,21 @@ class FrequencySweeper:
         self.input_device = input_device
         self.current_freq = None
         self.is_playing = False
-        self.phase = 0
+        # Oscillator state for the sine recurrence, see _oscillate()
+        self.osc_coeff = 0.0
+        self.osc_s1 = 0.0
+        self.osc_s2 = 0.0
+        self.tone_buffer = np.zeros(BLOCK_SIZE)
         self.results_file = open(f"frequency_sweep_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log", 'w')  # noqa: SIM115
 
     def log(self, message):
-        """Log to console and file."""
+        """Log to console and file.
+
+        File writes are buffered; test_frequency() flushes once per frequency
+        so no flush lands inside the capture loop.
+        """
         print(message)
         self.results_file.write(f"{datetime.now().strftime('%H:%M:%S.%f')[:-3]} {message}\n")
-        self.results_file.flush()
 
     def play_callback(self, outdata, frames, time_info, status):
         """Audio callback for tone generation."""
@@ -79,106 +176,148 @@ class FrequencySweeper:
             outdata.fill(0)
             return
 
-        # Generate tone
-        t = (np.arange(frames) + self.phase) / SAMPLE_RATE
-        sine_wave = AMPLITUDE * np.sin(2 * np.pi * self.current_freq * t)
+        # Generate tone without transcendental calls in the audio thread
+        if frames > len(self.tone_buffer):
+            self.tone_buffer = np.zeros(frames)
+        self.osc_s1, self.osc_s2 = _oscillate(self.tone_buffer, frames, self.osc_coeff,
+                                              self.osc_s1, self.osc_s2)
+        sine_wave = self.tone_buffer[:frames]
 
         # Output to right channel (ring) for tone
         outdata[:, 0] = 0  # Left channel silent
         outdata[:, 1] = sine_wave  # Right channel tone
 
-        self.phase = (self.phase + frames) % SAMPLE_RATE
+    def set_tone(self, freq):
+        """Reset the oscillator so the next callback starts freq at zero phase."""
+        w = 2 * math.pi * freq / SAMPLE_RATE
+        self.osc_coeff = 2 * math.cos(w)
+        self.osc_s1 = math.sin(-w)
+        self.osc_s2 = math.sin(-2 * w)
+        self.current_freq = freq
 
-    def analyze_signal(self, audio_data, freq):
-        """Analyze signal quality for a given frequency."""
-        # Goertzel detection
-        normalized_freq = freq / SAMPLE_RATE
-        goertzel_level, _ = G.goertzel(audio_data, normalized_freq)
+    def analyze_signal(self, blocks, freq):
+        """Analyze signal quality of every captured block for a given frequency.
 
-        # FFT analysis for additional metrics
-        fft_data = np.fft.rfft(audio_data)
-        freqs = np.fft.rfftfreq(len(audio_data), 1/SAMPLE_RATE)
-        magnitudes = np.abs(fft_data)
+        All blocks are transformed with one batched FFT. The Goertzel level is
+        read straight from the FFT bin fastgoertzel would evaluate
+        (k = floor(freq * N), amplitude 2|X[k]|/N), so no per-block Goertzel
+        call is needed.
+
+        Args:
+            blocks: float32 audio samples shaped (block_count, BLOCK_SIZE)
+            freq: Frequency under test in Hz
+
+        Returns:
+            np.ndarray: One row of metrics per block in METRIC_FIELDS order
+        """
+        block_count, block_size = blocks.shape
+
+        # FFT analysis of all blocks at once (scipy keeps float32 input in complex64)
+        fft_data = scipy.fft.rfft(blocks, axis=1)
+        freqs = np.fft.rfftfreq(block_size, 1/SAMPLE_RATE)
+
+        # Goertzel detection, taken from the matching FFT bin
+        goertzel_bin = int(freq / SAMPLE_RATE * block_size)
+        goertzel_level = 2 * np.abs(fft_data[:, goertzel_bin]) / block_size
 
         # Find peak near target frequency
         target_idx = np.argmin(np.abs(freqs - freq))
         window = 10  # bins
         start = max(0, target_idx - window)
-        end = min(len(magnitudes), target_idx + window + 1)
+        end = min(len(freqs), target_idx + window + 1)
 
-        peak_mag = np.max(magnitudes[start:end])
-        peak_idx = start + np.argmax(magnitudes[start:end])
+        # Peak and noise (everything outside the window) in one compiled pass
+        peak_mag, peak_idx, noise_power = _window_stats(fft_data, start, end)
         peak_freq = freqs[peak_idx]
 
         # Calculate SNR (signal-to-noise ratio)
         signal_power = peak_mag ** 2
-        # Noise is everything outside the window
-        noise_mask = np.ones(len(magnitudes), dtype=bool)
-        noise_mask[start:end] = False
-        noise_power = np.mean(magnitudes[noise_mask] ** 2)
-        snr_db = 10 * np.log10(signal_power / noise_power) if noise_power > 0 else 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            snr_db = np.where(noise_power > 0, 10 * np.log10(signal_power / noise_power), 0.0)
 
         # Calculate frequency accuracy
-        freq_error = abs(peak_freq - freq)
-        freq_error_percent = (freq_error / freq) * 100
+        freq_error_percent = np.abs(peak_freq - freq) / freq * 100
 
         # Cable attenuation estimate (simplified model)
         # Higher frequencies attenuate more with cable length
-        cable_attenuation_db = (freq / 1000) * 0.5  # ~0.5dB per kHz (simplified)
-
-        return {
-            'goertzel_level': goertzel_level,
-            'peak_magnitude': peak_mag,
-            'peak_frequency': peak_freq,
-            'frequency_error': freq_error,
-            'frequency_error_percent': freq_error_percent,
-            'snr_db': snr_db,
-            'cable_attenuation_estimate': cable_attenuation_db,
-            'detected': goertzel_level > DETECTION_THRESHOLD
-        }
+        cable_attenuation_db = np.full(block_count, (freq / 1000) * 0.5)  # ~0.5dB per kHz
+
+        return np.column_stack((goertzel_level, snr_db, freq_error_percent,
+                                cable_attenuation_db, peak_mag))
 
     def test_frequency(self, freq):
         """Test a single frequency."""
         self.log(f"\n--- Testing {freq} Hz ---")
 
         # Start playing tone
-        self.current_freq = freq
-        self.phase = 0
+        self.set_tone(freq)
         self.is_playing = True
 
         # Wait for tone to stabilize
         time.sleep(0.5)
 
-        # Collect multiple samples
-        samples = []
+        # Capture in chunks while a worker thread analyzes the previous ones
         sample_count = int((TONE_DURATION - 0.5) * SAMPLE_RATE / BLOCK_SIZE)
+        # NaN until analyzed, so a row the worker never wrote can't pass as data
+        metrics = np.full((sample_count, len(METRIC_FIELDS)), np.nan)
+        chunks = queue.Queue(maxsize=ANALYSIS_QUEUE_SIZE)
+        worker_error = []
+
+        def analyze_chunks():
+            # Keep draining to the sentinel even after a failure, so the
+            # capture loop's put() calls can never block on a full queue
+            while True:
+                item = chunks.get()
+                if item is None:
+                    break
+                if worker_error:
+                    continue
+                first, blocks = item
+                try:
+                    metrics[first:first + len(blocks)] = self.analyze_signal(blocks, freq)
+                except Exception as e:
+                    worker_error.append(e)
+
+        analyzer = threading.Thread(target=analyze_chunks, daemon=True)
+        analyzer.start()
+        try:
+            with sd.InputStream(device=self.input_device, channels=1,
+                               samplerate=SAMPLE_RATE, blocksize=BLOCK_SIZE) as stream:
+                for first in range(0, sample_count, ANALYSIS_CHUNK_BLOCKS):
+                    if worker_error:
+                        break  # Analysis already failed; stop capturing
+                    block_count = min(ANALYSIS_CHUNK_BLOCKS, sample_count - first)
+                    audio, overflowed = stream.read(block_count * BLOCK_SIZE)
+                    if overflowed:
+                        self.log(f"  Input overflow at sample {first}")
+
+                    blocks = audio[:, 0].astype(np.float32, copy=False)
+                    chunks.put((first, blocks.reshape(block_count, BLOCK_SIZE)))
+        finally:
+            chunks.put(None)
+            analyzer.join()
 
-        with sd.InputStream(device=self.input_device, channels=1,
-                           samplerate=SAMPLE_RATE, blocksize=BLOCK_SIZE) as stream:
-            for i in range(sample_count):
-                audio, overflowed = stream.read(BLOCK_SIZE)
-                if overflowed:
-                    self.log(f"  Input overflow at sample {i}")
+        # Stop tone
+        self.is_playing = False
 
-                audio_data = audio[:, 0].astype(np.float64)
-                result = self.analyze_signal(audio_data, freq)
-                samples.append(result)
+        # Surface analysis failures here rather than in the worker thread
+        if worker_error:
+            raise worker_error[0]
+        if np.isnan(metrics[:, 0]).any():
+            raise RuntimeError(f"Analysis incomplete for {freq} Hz")
 
-                # Log every 10th sample
-                if i % 10 == 0:
-                    self.log(f"  Sample {i}: Goertzel={result['goertzel_level']:.4f}, "
-                           f"SNR={result['snr_db']:.1f}dB, "
-                           f"Detected={'YES' if result['detected'] else 'NO'}")
+        # Per-block detection decisions
+        detected = metrics[:, 0] > DETECTION_THRESHOLD
 
-        # Stop tone
-        self.is_playing = False
+        # Log every 10th sample, only once capture has finished
+        for i in range(0, sample_count, 10):
+            self.log(f"  Sample {i}: Goertzel={metrics[i, 0]:.4f}, "
+                   f"SNR={metrics[i, 1]:.1f}dB, "
+                   f"Detected={'YES' if detected[i] else 'NO'}")
 
-        # Aggregate results
-        detection_rate = sum(1 for s in samples if s['detected']) / len(samples) * 100
-        avg_goertzel = np.mean([s['goertzel_level'] for s in samples])
-        avg_snr = np.mean([s['snr_db'] for s in samples])
-        avg_freq_error = np.mean([s['frequency_error_percent'] for s in samples])
-        avg_cable_atten = np.mean([s['cable_attenuation_estimate'] for s in samples])
+        # Aggregate results in a single pass over the metrics array
+        detection_rate = detected.mean() * 100
+        avg_goertzel, avg_snr, avg_freq_error, avg_cable_atten, _avg_peak = metrics.mean(axis=0)
 
         # Store results
         test_results[freq] = {
@@ -187,7 +326,7 @@ class FrequencySweeper:
             'avg_snr_db': avg_snr,
             'avg_freq_error_percent': avg_freq_error,
             'est_cable_attenuation_db': avg_cable_atten,
-            'samples': len(samples)
+            'samples': sample_count
         }
 
         self.log(f"  Results: Detection={detection_rate:.1f}%, "
@@ -195,6 +334,7 @@ class FrequencySweeper:
                f"Avg SNR={avg_snr:.1f}dB, "
                f"Freq Error={avg_freq_error:.2f}%, "
                f"Est Cable Loss={avg_cable_atten:.1f}dB")
+        self.results_file.flush()
 
         return test_results[freq]
 
@@ -208,6 +348,10 @@ class FrequencySweeper:
         self.log("Physical connection: Ariel (device 5) → Eros (device 1)")
         self.log("Note: Production statues with long cables work best at ~10kHz")
 
+        # Compile the Numba kernels before the first tone is measured
+        self.analyze_signal(np.zeros((1, BLOCK_SIZE), dtype=np.float32), TEST_FREQUENCIES[0])
+        _oscillate(self.tone_buffer, 0, 0.0, 0.0, 0.0)
+
         # Create output stream
         with sd.OutputStream(device=self.output_device, channels=2,
                            samplerate=SAMPLE_RATE, blocksize=BLOCK_SIZE,
@@ -309,12 +453,16 @@ class FrequencySweeper:
             (14000, 20000, "High")
         ]
 
+        # Conflicts between every pair of candidates, computed once up front
+        conflicts = harmonic_conflicts(np.array([f for f, _ in excellent_freqs], dtype=np.float64))
+        eligible = np.ones(len(excellent_freqs), dtype=bool)
+
         selected = []
         zone_counts = {i: 0 for i in range(len(zones))}
 
         # First pass: Try to get one frequency from each zone
         for zone_idx, (zone_min, zone_max, _zone_name) in enumerate(zones):
-            zone_candidates = [(f, r) for f, r in excellent_freqs
+            zone_candidates = [(i, f, r) for i, (f, r) in enumerate(excellent_freqs)
                              if zone_min <= f < zone_max]
 
             if not zone_candidates:
@@ -323,7 +471,7 @@ class FrequencySweeper:
             # Score candidates (prefer middle of zone and good metrics)
             zone_center = (zone_min + zone_max) / 2
             scored_candidates = []
-            for f, r in zone_candidates:
+            for i, f, r in zone_candidates:
                 score = r['detection_rate'] + r['avg_snr_db']
                 # Bonus for being near zone center
                 center_distance = abs(f - zone_center) / (zone_max - zone_min)
@@ -331,47 +479,29 @@ class FrequencySweeper:
                 # Special bonus for proven frequencies
                 if f in [7040, 10000, 10079]:
                     score += 5
-                scored_candidates.append((f, score))
+                scored_candidates.append((i, f, score))
 
-            scored_candidates.sort(key=lambda x: x[1], reverse=True)
+            scored_candidates.sort(key=lambda x: x[2], reverse=True)
 
             # Try candidates until we find one that's non-harmonic
-            for freq, score in scored_candidates:
-                is_valid = True
-
-                for sel_freq, _ in selected:
-                    ratio = max(freq, sel_freq) / min(freq, sel_freq)
-                    # Check harmonic ratios and minimum separation
-                    if ratio < 1.2 or any(abs(ratio - r) < 0.05
-                                         for r in [2.0, 1.5, 1.33, 1.25, 3.0, 4.0, 5.0]):
-                        is_valid = False
-                        break
-
-                if is_valid:
+            for i, freq, score in scored_candidates:
+                if eligible[i]:
                     selected.append((freq, score))
+                    eligible &= ~conflicts[i]
                     zone_counts[zone_idx] += 1
                     break
 
         # Second pass: Fill remaining slots with best frequencies
         if len(selected) < count:
-            # Get all candidates not yet selected
-            remaining = [(f, r['detection_rate'] + r['avg_snr_db'])
-                        for f, r in excellent_freqs
-                        if not any(f == sel_f for sel_f, _ in selected)]
-            remaining.sort(key=lambda x: x[1], reverse=True)
-
-            for freq, score in remaining:
-                is_valid = True
-
-                for sel_freq, _ in selected:
-                    ratio = max(freq, sel_freq) / min(freq, sel_freq)
-                    if ratio < 1.2 or any(abs(ratio - r) < 0.05
-                                         for r in [2.0, 1.5, 1.33, 1.25, 3.0, 4.0, 5.0]):
-                        is_valid = False
-                        break
+            # Selected frequencies conflict with themselves, so they are no longer eligible
+            remaining = [(i, f, r['detection_rate'] + r['avg_snr_db'])
+                        for i, (f, r) in enumerate(excellent_freqs)]
+            remaining.sort(key=lambda x: x[2], reverse=True)
 
-                if is_valid:
+            for i, freq, score in remaining:
+                if eligible[i]:
                     selected.append((freq, score))
+                    eligible &= ~conflicts[i]
                     if len(selected) >= count:
                         break
 
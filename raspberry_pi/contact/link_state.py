@@ -11,8 +11,10 @@ Key Concepts:
 - The system maintains both detailed link information and summary states
 
 State Management:
-- links: Detailed tracking of which statues are connected to which
-- has_links: Simple boolean state for audio channel control
+- links: Detailed tracking of which statues are connected to which, stored
+  as one adjacency bitmask per statue (bit j set = linked to statue j)
+- has_links: Simple boolean state for audio channel control, derived from
+  the adjacency masks on demand rather than stored alongside them
 - Audio channels toggle automatically based on link state changes
 
 Example:
@@ -25,16 +27,37 @@ Example:
       ♪ Audio channel 1 ON for elektra
 """
 
-from typing import TYPE_CHECKING, Optional
+import sys
+from typing import TYPE_CHECKING, Callable, Optional
 
 import ultraimport as ui
 
 Statue = ui.ultraimport("__dir__/../config/constants.py", "Statue")
 
+# Statues in enum order; bit i of a link mask refers to _STATUES[i]
+_STATUES = tuple(Statue)
+_STATUE_VALUES = tuple(statue.value for statue in _STATUES)
+# Flag set in _update_link_core's result when the link itself changed
+_LINK_CHANGED_BIT = 1 << len(_STATUES)
+
 if TYPE_CHECKING:
     from audio.music import ToggleableMultiChannelPlayback
 
 
+def _discard(_message: str) -> None:
+    """Message sink used in quiet mode."""
+
+
+def _bit_indices(mask: int) -> list[int]:
+    """Return the positions of the bits set in mask, lowest first."""
+    indices = []
+    while mask:
+        low = mask & -mask
+        indices.append(low.bit_length() - 1)
+        mask ^= low
+    return indices
+
+
 class LinkStateTracker:
     """Tracks link states between statues and manages audio activation.
 
@@ -48,13 +71,23 @@ class LinkStateTracker:
     - Providing both detailed and summary views of connection state
 
     Attributes:
-        links (dict): Maps each statue to set of connected statues
-        has_links (dict): Quick lookup for whether statue has any links
+        links (dict): Maps each statue to set of connected statues, built
+            from the adjacency bitmasks on access
+        has_links (dict): Quick lookup for whether statue has any links,
+            derived from the adjacency bitmasks on access
         playback: Optional ToggleableMultiChannelPlayback instance
         statue_to_channel (dict): Maps statue to audio channel index
         quiet (bool): Suppress console output when True
     """
 
+    # links and has_links are properties over _adj
+    __slots__ = (
+        '_adj', '_idx', 'playback', '_toggle', '_apply_states', '_has_channel_mask',
+        'statue_to_channel', 'quiet', '_emit', '_version',
+        '_msg_audio_on', '_msg_audio_off', '_msg_link_status', '_msg_activity',
+        '_msg_established', '_msg_broken', '_msg_added', '_msg_removed',
+    )
+
     def __init__(self, playback: Optional['ToggleableMultiChannelPlayback'] = None, quiet: bool = False) -> None:
         """Initialize link state tracker.
 
@@ -63,35 +96,113 @@ class LinkStateTracker:
                 for automatic channel management. If None, only tracks state.
             quiet (bool): Suppress console output for silent operation
         """
-        # Track which statues are linked to which
-        self.links = {}  # {statue: set(linked_statues)}
-        # Track link state for each statue (any links at all)
-        self.has_links = {}  # {statue: bool}
-        # Initialize all statues as unlinked
-        for statue in Statue:
-            self.links[statue] = set()
-            self.has_links[statue] = False
+        self._idx = {statue: i for i, statue in enumerate(_STATUES)}
+        # Track which statues are linked to which, one adjacency bitmask per statue
+        self._adj = [0] * len(_STATUES)
         # Audio playback controller
         self.playback = playback
+        # Channel toggle bound once; players name it toggle_channel or toggle_music_channel
+        self._toggle: Optional[Callable[[int], object]] = (
+            getattr(playback, 'toggle_channel', None) or getattr(playback, 'toggle_music_channel', None)
+        )
+        # Players exposing channel_enabled_mask can be read without touching the list
+        self._has_channel_mask = hasattr(playback, 'channel_enabled_mask')
+        # Batch setter for several channels at once, if the player has one
+        self._apply_states: Optional[Callable[[list[tuple[int, bool]]], object]] = (
+            getattr(playback, 'apply_channel_states', None)
+        )
         # Map statue to channel index using enum order
-        self.statue_to_channel = {statue: list(Statue).index(statue) for statue in Statue}
+        self.statue_to_channel = dict(self._idx)
         # Quiet mode suppresses print statements
         self.quiet = quiet
+        # Message sink bound once so hot paths don't re-check quiet
+        self._emit: Callable[[str], None] = _discard if quiet else print
+        # Bumped on every link change so viewers can skip redundant redraws
+        self._version = 0
+
+        # Status messages never change for a given statue, so format them once
+        names = _STATUE_VALUES
+        self._msg_audio_on = {statue: f"  ♪ Audio channel {channel} ON for {names[self._idx[statue]]}"
+                              for statue, channel in self.statue_to_channel.items()}
+        self._msg_audio_off = {statue: f"  ♪ Audio channel {channel} OFF for {names[self._idx[statue]]}"
+                               for statue, channel in self.statue_to_channel.items()}
+        # Indexed [statue][state] with state False/True
+        self._msg_link_status = [(f"  → {name} is now unlinked", f"  → {name} is now linked")
+                                 for name in names]
+        self._msg_activity = [(f"  → {name} is now dormant", f"  → {name} is now active")
+                              for name in names]
+        # Indexed [detector][other]
+        self._msg_established = [[f"🔗 Link established: {a} ↔ {b}" for b in names] for a in names]
+        self._msg_broken = [[f"🔌 Link broken: {a} ↔ {b}" for b in names] for a in names]
+        self._msg_added = [[f"🔗 Link added: {a} → {b}" for b in names] for a in names]
+        self._msg_removed = [[f"🔌 Link removed: {a} → {b}" for b in names] for a in names]
+
+    @property
+    def links(self) -> dict[Statue, set[Statue]]:
+        """Map each statue to the set of statues it is linked to."""
+        return {statue: set(self._statues_in(self._adj[i])) for i, statue in enumerate(_STATUES)}
+
+    @links.setter
+    def links(self, links: dict[Statue, set[Statue]]) -> None:
+        adj = [0] * len(_STATUES)
+        for statue, linked_set in links.items():
+            for other in linked_set:
+                adj[self._idx[statue]] |= 1 << self._idx[other]
+        self._adj = adj
+        self._version += 1
+
+    @property
+    def has_links(self) -> dict[Statue, bool]:
+        """Map each statue to whether it currently has any links."""
+        has_mask = self._has_links_mask()
+        return {statue: bool(has_mask >> i & 1) for i, statue in enumerate(_STATUES)}
+
+    def _has_links_mask(self) -> int:
+        """Return the bitmask of statues with any links.
+
+        A statue has links if it detects anyone (outgoing) or anyone other
+        than itself detects it (incoming).
+        """
+        has_mask = 0
+        for k, mask in enumerate(self._adj):
+            if mask:
+                has_mask |= (1 << k) | (mask & ~(1 << k))
+        return has_mask
+
+    def _statues_in(self, mask: int) -> list[Statue]:
+        """Return the statues whose bits are set in mask, in enum order."""
+        return [_STATUES[k] for k in _bit_indices(mask)]
+
+    def _update_audio_channel(self, statue: Statue, is_linked: bool, emit: Callable[[str], None],
+                              pending: Optional[list[tuple[int, bool]]] = None) -> None:
+        """Helper to update audio channel based on link state.
 
-    def _update_audio_channel(self, statue: Statue, is_linked: bool) -> None:
-        """Helper to update audio channel based on link state."""
-        if self.playback and statue in self.statue_to_channel:
-            channel = self.statue_to_channel[statue]
-            if is_linked and not self.playback.channel_enabled[channel]:
-                # Turn on channel
-                self.playback.toggle_music_channel(channel)
-                if not self.quiet:
-                    print(f"  ♪ Audio channel {channel} ON for {statue.value}")
-            elif not is_linked and self.playback.channel_enabled[channel]:
-                # Turn off channel
-                self.playback.toggle_music_channel(channel)
-                if not self.quiet:
-                    print(f"  ♪ Audio channel {channel} OFF for {statue.value}")
+        Args:
+            statue (Statue): Statue whose channel should follow its link state
+            is_linked (bool): New link state
+            emit (Callable): Sink for the status message
+            pending (list, optional): If given, the (channel, enabled) change is
+                queued here for the caller to apply in one batch instead of
+                toggling the channel immediately
+        """
+        if self.playback is None:
+            return
+
+        # Every statue has a channel, so index directly
+        channel = self.statue_to_channel[statue]
+        if self._has_channel_mask:
+            currently_enabled = bool(self.playback.channel_enabled_mask >> channel & 1)
+        else:
+            currently_enabled = bool(self.playback.channel_enabled[channel])
+        if is_linked == currently_enabled:
+            return
+
+        # Turn channel on or off
+        if pending is None:
+            self._toggle(channel)
+        else:
+            pending.append((channel, is_linked))
+        emit(self._msg_audio_on[statue] if is_linked else self._msg_audio_off[statue])
 
     def update_link(self, detector_statue: Statue, source_statue: Statue, is_linked: bool) -> bool:
         """Update link state between two statues.
@@ -117,50 +228,62 @@ class LinkStateTracker:
             - May toggle audio channels via playback controller
             - Prints status messages (unless quiet=True)
         """
-        changed = False
+        i = self._idx[detector_statue]
+        j = self._idx[source_statue]
+        changed_mask = self._update_link_core(i, j, is_linked)
+        if not changed_mask:
+            return False
+        self._version += 1
 
-        if is_linked:
-            # Add link if not already present
-            if source_statue not in self.links[detector_statue]:
-                self.links[detector_statue].add(source_statue)
-                self.links[source_statue].add(detector_statue)
-                changed = True
-                if not self.quiet:
-                    print(f"🔗 Link established: {detector_statue.value} ↔ {source_statue.value}")
-        else:
-            # Remove link if present
-            if source_statue in self.links[detector_statue]:
-                self.links[detector_statue].remove(source_statue)
-                self.links[source_statue].remove(detector_statue)
-                changed = True
-                if not self.quiet:
-                    print(f"🔌 Link broken: {detector_statue.value} ↔ {source_statue.value}")
+        emit = self._emit
+        if changed_mask & _LINK_CHANGED_BIT:
+            emit(self._msg_established[i][j] if is_linked else self._msg_broken[i][j])
+
+        # Check if overall link status changed
+        for k, statue in ((i, detector_statue), (j, source_statue)):
+            if changed_mask >> k & 1:
+                now_linked = bool(self._adj[k])
+                emit(self._msg_link_status[k][now_linked])
+                # Update audio channel
+                self._update_audio_channel(statue, now_linked, emit)
 
-        # Update has_links status
-        old_has_links_detector = self.has_links[detector_statue]
-        old_has_links_source = self.has_links[source_statue]
+        return True
 
-        self.has_links[detector_statue] = len(self.links[detector_statue]) > 0
-        self.has_links[source_statue] = len(self.links[source_statue]) > 0
+    def _update_link_core(self, i: int, j: int, is_linked: bool) -> int:
+        """Apply a bidirectional link change using integer operations only.
 
-        # Check if overall link status changed
-        if old_has_links_detector != self.has_links[detector_statue]:
-            status = "linked" if self.has_links[detector_statue] else "unlinked"
-            if not self.quiet:
-                print(f"  → {detector_statue.value} is now {status}")
-            changed = True
-            # Update audio channel
-            self._update_audio_channel(detector_statue, self.has_links[detector_statue])
+        Args:
+            i (int): Index of the detector statue
+            j (int): Index of the source statue
+            is_linked (bool): True to add the link, False to remove it
 
-        if old_has_links_source != self.has_links[source_statue]:
-            status = "linked" if self.has_links[source_statue] else "unlinked"
-            if not self.quiet:
-                print(f"  → {source_statue.value} is now {status}")
-            changed = True
-            # Update audio channel
-            self._update_audio_channel(source_statue, self.has_links[source_statue])
+        Returns:
+            int: Bitmask of statues whose has-links state flipped, with
+            _LINK_CHANGED_BIT also set if the link itself was added or removed
+        """
+        adj = self._adj
+        bit_i = 1 << i
+        bit_j = 1 << j
+        # Links here are symmetric, so a statue has links iff its own mask is non-empty
+        old_has = (bit_i if adj[i] else 0) | (bit_j if adj[j] else 0)
 
-        return changed
+        changed_mask = 0
+        if is_linked:
+            # Add link if not already present
+            if not adj[i] & bit_j:
+                adj[i] |= bit_j
+                adj[j] |= bit_i
+                changed_mask = _LINK_CHANGED_BIT
+        else:
+            # Remove link if present
+            if adj[i] & bit_j:
+                adj[i] &= ~bit_j
+                adj[j] &= ~bit_i
+                changed_mask = _LINK_CHANGED_BIT
+
+        # Derive has_links for both ends, noting which bits flipped
+        new_has = (bit_i if adj[i] else 0) | (bit_j if adj[j] else 0)
+        return changed_mask | (new_has ^ old_has)
 
     def update_detector_emitters(self, detector: Statue, emitters: list[Statue]) -> bool:
         """Update all links for a detector based on MQTT emitters list.
@@ -185,53 +308,63 @@ class LinkStateTracker:
             >>> tracker.update_detector_emitters(Statue.EROS, [Statue.ELEKTRA, Statue.SOPHIA])
         """
         changed = False
-        new_emitters = set(emitters)
-        old_emitters = self.links[detector].copy()
-
-        # Find emitters that were added or removed
-        added_emitters = new_emitters - old_emitters
-        removed_emitters = old_emitters - new_emitters
+        # Collect messages so a burst of changes is written in one go
+        messages: list[str] = []
+        emit = _discard if self.quiet else messages.append
+        d = self._idx[detector]
+        new_mask = 0
+        for emitter in emitters:
+            new_mask |= 1 << self._idx[emitter]
+        old_mask = self._adj[d]
+
+        # Repeated reports (heartbeats) change nothing: the detector's own
+        # has-links bit was settled when its outgoing links last changed
+        if new_mask == old_mask:
+            return False
+
+        # Emitters that were added or removed, in a single XOR
+        diff_mask = new_mask ^ old_mask
+        old_has = self._has_links_mask()
 
         # Update only detector's outgoing links (unidirectional)
-        if added_emitters or removed_emitters:
-            self.links[detector] = new_emitters
+        if diff_mask:
+            self._adj[d] = new_mask
+            self._version += 1
             changed = True
 
             # Print changes
-            for emitter in removed_emitters:
-                if not self.quiet:
-                    print(f"🔌 Link removed: {detector.value} → {emitter.value}")
-
-            for emitter in added_emitters:
-                if not self.quiet:
-                    print(f"🔗 Link added: {detector.value} → {emitter.value}")
-
-        # Compute has_links for all affected statues using OR logic
-        # Affected statues: detector + all added/removed emitters
-        affected_statues = {detector} | added_emitters | removed_emitters
-
-        for statue in affected_statues:
-            old_has_links = self.has_links[statue]
-
-            # Check outgoing links (what this statue detects)
-            has_outgoing = len(self.links[statue]) > 0
-
-            # Check incoming links (who detects this statue)
-            has_incoming = any(statue in self.links[other] for other in Statue if other != statue)
+            for k in _bit_indices(diff_mask & old_mask):
+                emit(self._msg_removed[d][k])
+
+            for k in _bit_indices(diff_mask & new_mask):
+                emit(self._msg_added[d][k])
+
+        # Derive has_links again using OR logic; only the detector and the
+        # added/removed emitters can have flipped
+        new_has = self._has_links_mask()
+        changed_bits = new_has ^ old_has
+
+        # Update audio and print status for statues whose state changed,
+        # queuing channel changes so the player applies them together
+        pending: Optional[list[tuple[int, bool]]] = [] if self._apply_states else None
+        for k in _bit_indices(changed_bits):
+            now_active = bool(new_has >> k & 1)
+            emit(self._msg_activity[k][now_active])
+            changed = True
+            self._update_audio_channel(_STATUES[k], now_active, emit, pending)
 
-            # OR logic: active if either direction has links
-            self.has_links[statue] = has_outgoing or has_incoming
+        if pending:
+            self._apply_states(pending)
 
-            # Update audio and print status if state changed
-            if old_has_links != self.has_links[statue]:
-                status = "active" if self.has_links[statue] else "dormant"
-                if not self.quiet:
-                    print(f"  → {statue.value} is now {status}")
-                changed = True
-                self._update_audio_channel(statue, self.has_links[statue])
+        if messages:
+            sys.stdout.write("\n".join(messages) + "\n")
 
         return changed
 
+    def get_version(self) -> int:
+        """Return a counter that increases whenever any link changes."""
+        return self._version
+
     def get_detector_emitters(self) -> dict[Statue, list[Statue]]:
         """Return current state in detector→emitters format.
 
@@ -245,25 +378,37 @@ class LinkStateTracker:
             >>> tracker.get_detector_emitters()
             {Statue.EROS: [Statue.ELEKTRA], Statue.ELEKTRA: [Statue.EROS], ...}
         """
-        return {statue: list(linked_set) for statue, linked_set in self.links.items()}
+        result = {}
+        for statue, mask in zip(_STATUES, self._adj):
+            # Walk set bits lowest first, straight into the emitter list
+            emitters = []
+            while mask:
+                low = mask & -mask
+                emitters.append(_STATUES[low.bit_length() - 1])
+                mask ^= low
+            result[statue] = emitters
+        return result
 
     def get_link_summary(self) -> str:
         """Return human-readable link summary."""
         summary = []
         summary.append("=== Current Link Status ===")
 
-        # Show linked statues
-        linked = [s for s in Statue if self.has_links[s]]
-        unlinked = [s for s in Statue if not self.has_links[s]]
+        # Show linked statues, partitioned from the has-links mask in one pass
+        has_mask = self._has_links_mask()
+        linked: list[int] = []
+        unlinked: list[int] = []
+        for i in range(len(_STATUES)):
+            (linked if has_mask >> i & 1 else unlinked).append(i)
 
         if linked:
             summary.append("Linked statues:")
-            for statue in linked:
-                linked_to = ", ".join([s.value for s in self.links[statue]])
-                summary.append(f"  {statue.value} ↔ {linked_to}")
+            for i in linked:
+                linked_to = ", ".join([_STATUE_VALUES[j] for j in _bit_indices(self._adj[i])])
+                summary.append(f"  {_STATUE_VALUES[i]} ↔ {linked_to}")
 
         if unlinked:
             summary.append("Unlinked statues:")
-            summary.append("  " + ", ".join([s.value for s in unlinked]))
+            summary.append("  " + ", ".join([_STATUE_VALUES[i] for i in unlinked]))
 
         return "\n".join(summary)
@@ -1,6 +1,6 @@
 #!/usr/bin/env -S uv run --script
 # /// script
-# dependencies = ["fastgoertzel", "numpy", "sounddevice", "soundfile"]
+# dependencies = ["numba", "numpy", "sounddevice", "soundfile"]
 # ///
 
 """Unit tests for basic transmission/detection functionality.
@@ -9,16 +9,17 @@ Tests the fundamental tone transmission and detection between connected
 EROS and ELEKTRA statues, bypassing coordinator complexity.
 """
 
+import contextlib
 import time
 import unittest
 
-import fastgoertzel as G
 import numpy as np
 import sounddevice as sd
 
 from audio.devices import Statue, configure_devices, dynConfig
 from contact.audio_setup import initialize_audio_playback
 from contact.config import TONE_FREQUENCIES
+from contact.tone_detect import goertzel_coeffs, goertzel_multi
 
 
 class TestBasicTransmission(unittest.TestCase):
@@ -47,6 +48,25 @@ class TestBasicTransmission(unittest.TestCase):
             if statue in TONE_FREQUENCIES:
                 dynConfig[statue.value]["tone_freq"] = TONE_FREQUENCIES[statue]
 
+        # Scratch buffers reused by every detection measurement
+        cls.scratch = np.empty(dynConfig["block_size"], dtype=np.float64)
+        cls.level_out = np.empty(1)
+
+        # Open one input stream per detector, reused by every test
+        cls.streams = {}
+        for device in cls.devices:
+            statue = device['statue']
+            config = dynConfig[statue.value]["detect"]
+            if config["device_index"] != -1:
+                stream = sd.InputStream(
+                    device=config["device_index"],
+                    channels=1,
+                    samplerate=config["sample_rate"],
+                    blocksize=dynConfig["block_size"],
+                )
+                stream.start()
+                cls.streams[statue] = stream
+
         # Let audio system initialize
         time.sleep(1.0)
         print("✓ Test setup complete\n")
@@ -54,6 +74,9 @@ class TestBasicTransmission(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Clean up after all tests."""
+        for stream in getattr(cls, 'streams', {}).values():
+            stream.stop()
+            stream.close()
         if hasattr(cls, 'audio_playback') and cls.audio_playback:
             cls.audio_playback.stop()
         print("\n✓ Test cleanup complete")
@@ -64,7 +87,6 @@ class TestBasicTransmission(unittest.TestCase):
         if self.__class__.audio_playback:
             for i in range(len(self.__class__.devices)):
                 self.__class__.audio_playback.set_tone_channel(i, False)
-        time.sleep(0.1)  # Let system settle
 
     def test_eros_to_elektra_transmission(self):
         """Test EROS transmitting tone detected by ELEKTRA."""
@@ -102,7 +124,6 @@ class TestBasicTransmission(unittest.TestCase):
         if self.__class__.audio_playback:
             for i in range(len(self.__class__.devices)):
                 self.__class__.audio_playback.set_tone_channel(i, False)
-        time.sleep(0.1)  # Let system settle
 
         threshold = dynConfig["touch_threshold"]
 
@@ -113,7 +134,9 @@ class TestBasicTransmission(unittest.TestCase):
             if config["device_index"] == -1:
                 continue
 
-            with self._create_input_stream(config) as stream:
+            with self._input_stream(statue) as stream:
+                self._wait_for_settled(stream)
+
                 # Test detection of all frequencies
                 for target_statue in [Statue.EROS, Statue.ELEKTRA]:
                     level = self._measure_detection_level(stream, target_statue, config)
@@ -137,13 +160,13 @@ class TestBasicTransmission(unittest.TestCase):
             if config["device_index"] == -1:
                 continue
 
-            with self._create_input_stream(config) as stream:
+            with self._input_stream(statue) as stream:
                 # Measure several reads to get average timing
                 durations = []
                 for _ in range(5):
-                    start_time = time.time()
+                    start_time = time.perf_counter()
                     _audio, overflowed = stream.read(dynConfig["block_size"])
-                    duration_ms = (time.time() - start_time) * 1000
+                    duration_ms = (time.perf_counter() - start_time) * 1000
                     durations.append(duration_ms)
 
                     self.assertFalse(overflowed, f"Audio overflow in {statue.value}")
@@ -176,7 +199,7 @@ class TestBasicTransmission(unittest.TestCase):
         self.assertNotEqual(config["device_index"], -1,
                            f"No input device configured for {detector.value}")
 
-        with self._create_input_stream(config) as stream:
+        with self._input_stream(detector) as stream:
             # Get transmitter channel index
             transmitter_channel = self._get_channel_index(transmitter)
             self.assertIsNotNone(transmitter_channel, f"Transmitter {transmitter.value} not found")
@@ -184,7 +207,7 @@ class TestBasicTransmission(unittest.TestCase):
             # Measure detection with transmission OFF
             print(f"  Phase 1: {transmitter.value} transmission OFF")
             self.__class__.audio_playback.set_tone_channel(transmitter_channel, False)
-            time.sleep(0.1)
+            self._wait_for_settled(stream)
 
             level_off = self._measure_detection_level(stream, transmitter, config)
             print(f"    Detection level: {level_off:.3f}")
@@ -192,7 +215,7 @@ class TestBasicTransmission(unittest.TestCase):
             # Measure detection with transmission ON
             print(f"  Phase 2: {transmitter.value} transmission ON")
             self.__class__.audio_playback.set_tone_channel(transmitter_channel, True)
-            time.sleep(0.1)
+            self._wait_for_settled(stream)
 
             level_on = self._measure_detection_level(stream, transmitter, config)
             print(f"    Detection level: {level_on:.3f}")
@@ -216,36 +239,53 @@ class TestBasicTransmission(unittest.TestCase):
                 'false_positive': false_positive
             }
 
-    def _create_input_stream(self, config):
-        """Create and return an input stream for the given config."""
-        return sd.InputStream(
-            device=config["device_index"],
-            channels=1,
-            samplerate=config["sample_rate"],
-            blocksize=dynConfig["block_size"],
-        )
+    @contextlib.contextmanager
+    def _input_stream(self, statue: Statue):
+        """Yield the shared input stream for a detector, flushed on entry.
+
+        The stream stays open for the whole class and keeps buffering while
+        other detectors are read, so stale audio is dropped before each use;
+        leaving the context does not close it.
+        """
+        stream = self.__class__.streams[statue]
+        self._flush(stream)
+        yield stream
+
+    def _flush(self, stream):
+        """Discard everything the stream has buffered so far."""
+        available = stream.read_available
+        if available:
+            stream.read(available)
+
+    def _wait_for_settled(self, stream, n_blocks: int = 1):
+        """Discard blocks captured before a tone change so the next read sees only new audio."""
+        for _ in range(n_blocks):
+            stream.read(dynConfig["block_size"])
 
     def _measure_detection_level(self, stream, target_statue: Statue, config):
         """Measure detection level for target statue's frequency."""
         # Read audio
-        start_time = time.time()
+        start_time = time.perf_counter()
         audio, overflowed = stream.read(dynConfig["block_size"])
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
 
         if overflowed:
             print("    WARNING: Audio overflow")
 
         print(f"    Audio read took {duration_ms:.1f}ms")
 
-        # Convert to float64 for Goertzel
-        audio_data = audio[:, 0].astype(np.float64)
+        # Convert to float64 for Goertzel into the shared scratch buffer
+        audio_data = self.__class__.scratch
+        np.copyto(audio_data, audio[:, 0])
 
-        # Get target frequency and perform detection
+        # Get target frequency and perform detection with the JIT-compiled
+        # Goertzel kernel shared with detect_tone
         freq = dynConfig[target_statue.value]["tone_freq"]
-        normalized_freq = freq / config["sample_rate"]
-        level, _ = G.goertzel(audio_data, normalized_freq)
+        coeffs = goertzel_coeffs([freq], config["sample_rate"], len(audio_data))
+        level_out = self.__class__.level_out
+        goertzel_multi(audio_data, coeffs, level_out)
 
-        return level
+        return float(level_out[0])
 
     def _get_channel_index(self, statue: Statue):
         """Get the channel index for a given statue."""
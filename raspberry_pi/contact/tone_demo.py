@@ -30,14 +30,31 @@ def create_tone_generator(frequency: float, sample_rate: int):
     This is the working implementation from tone_detect.py, copied here
     to avoid import dependencies.
     """
-    phase = 0
+    # Rotate a unit phasor by one sample's angle per sample instead of
+    # evaluating sin: the block is phasor * rotation**n, and the phasor
+    # then advances by rotation**frames to stay continuous across blocks.
+    # The ramp and the work/output buffers are sized on the first call and
+    # reused while the block length stays the same, so a callback allocates
+    # nothing; the returned block is overwritten by the next call
+    rotation = np.exp(2j * np.pi * frequency / sample_rate)
+    phasor = 1 + 0j
+    ramp = np.ones(0, dtype=np.complex128)
+    rotated = np.empty(0, dtype=np.complex128)
+    tone = np.empty(0)
+    block_step = 1 + 0j
 
     def generate_tone(frames):
-        nonlocal phase
-        t = (np.arange(frames) + phase) / sample_rate
-        tone = 0.5 * np.sin(2 * np.pi * frequency * t)
-        # Update phase for continuity
-        phase = (phase + frames) % int(sample_rate / frequency)
+        nonlocal phasor, ramp, rotated, tone, block_step
+        if len(ramp) != frames:
+            ramp = rotation ** np.arange(frames)
+            rotated = np.empty(frames, dtype=np.complex128)
+            tone = np.empty(frames)
+            block_step = rotation ** frames
+        np.multiply(ramp, phasor, out=rotated)
+        np.multiply(rotated.imag, 0.5, out=tone)
+        # Advance and renormalize so rounding never lets the amplitude drift
+        phasor *= block_step
+        phasor /= abs(phasor)
         return tone
 
     return generate_tone
@@ -61,9 +78,13 @@ class DynamicToneGenerator:
             self.base_generator = create_tone_generator(self.frequency, self.sample_rate)
 
     def __call__(self, frames):
-        """Generate tone samples using the working generator."""
-        with self.lock:
-            return self.base_generator(frames)
+        """Generate tone samples using the working generator.
+
+        Runs on the audio callback thread without taking the lock: rebinding
+        base_generator is atomic, so a callback sees either the old or the
+        new generator, and either produces a valid block.
+        """
+        return self.base_generator(frames)
 
 
 def handle_key_input(key, ui):
@@ -84,6 +105,7 @@ def handle_key_input(key, ui):
         statue_index = int(key) - 1
         if 0 <= statue_index < len(ui.devices):
             ui.selected_index = statue_index
+            ui.dirty = True
     return True  # Continue running
 
 
@@ -97,6 +119,8 @@ class InteractiveUI:
         self.tone_enabled = [True] * len(devices)
         self.running = True
         self.old_settings = None
+        # Set whenever displayed state changes; the run loop redraws only then
+        self.dirty = True
 
     def setup_terminal(self):
         """Set terminal to raw mode for immediate key capture."""
@@ -131,19 +155,21 @@ class InteractiveUI:
         print("\033[H", end='', flush=True)
 
     def draw_ui(self):
-        """Draw the interactive UI."""
+        """Draw the interactive UI as a single terminal write."""
         if not hasattr(self, 'first_draw'):
             self.first_draw = True
 
         if self.first_draw:
-            self.clear_screen()
+            # Clear screen
+            lines = ["\033[2J\033[H"]
             self.first_draw = False
         else:
-            self.move_cursor_home()
+            # Move cursor home
+            lines = ["\033[H"]
 
         # Header
-        print("=== Interactive Tone Generator ===\r\n\r", flush=True)
-        print("CONFIGURED STATUES:\r", flush=True)
+        lines.append("=== Interactive Tone Generator ===\r\n\r\n")
+        lines.append("CONFIGURED STATUES:\r\n")
 
         for i, device in enumerate(self.devices):
             statue = device['statue']
@@ -152,35 +178,40 @@ class InteractiveUI:
             cursor = ">" if i == self.selected_index else " "
 
             line = f"{cursor} {statue.value.upper():8s} [{freq:5d} Hz]  {status}"
-            print(f"{line:<50}\r", flush=True)  # Pad to ensure full line overwrite
+            lines.append(f"{line:<50}\r\n")  # Pad to ensure full line overwrite
 
-        print("\r", flush=True)
-        print("CONTROLS:\r", flush=True)
-        print("  W/S Select statue    A/D Frequency ±500Hz\r", flush=True)
-        print("  SPACE Toggle on/off  Q/ESC Quit\r", flush=True)
-        print("  1-9 Direct selection\r", flush=True)
-        print("\r", flush=True)
+        lines.append("\r\n")
+        lines.append("CONTROLS:\r\n")
+        lines.append("  W/S Select statue    A/D Frequency ±500Hz\r\n")
+        lines.append("  SPACE Toggle on/off  Q/ESC Quit\r\n")
+        lines.append("  1-9 Direct selection\r\n")
+        lines.append("\r\n")
 
         selected_statue = self.devices[self.selected_index]['statue']
         selected_freq = self.frequencies[self.selected_index]
         selected_status = "PLAYING" if self.tone_enabled[self.selected_index] else "MUTED"
         line1 = f"Selected: {selected_statue.value.upper()} ({selected_freq} Hz) - {selected_status}"
         line2 = "Frequency range: 500Hz - 20000Hz"
-        print(f"{line1:<60}\r", flush=True)
-        print(f"{line2:<60}\r", flush=True)
+        lines.append(f"{line1:<60}\r\n")
+        lines.append(f"{line2:<60}\r\n")
 
         # Add blank lines to ensure clean display
-        print("\r\n\r\n\r", end='', flush=True)
+        lines.append("\r\n\r\n\r")
+
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
 
     def navigate_up(self):
         """Move selection up to previous statue."""
         if self.selected_index > 0:
             self.selected_index -= 1
+            self.dirty = True
 
     def navigate_down(self):
         """Move selection down to next statue."""
         if self.selected_index < len(self.devices) - 1:
             self.selected_index += 1
+            self.dirty = True
 
     def adjust_frequency(self, delta):
         """Adjust frequency of selected statue by delta Hz."""
@@ -190,6 +221,7 @@ class InteractiveUI:
         # Only update if frequency actually changed
         if new_freq != current_freq:
             self.frequencies[self.selected_index] = new_freq
+            self.dirty = True
 
             # Update the tone generator if we have a reference to it
             if hasattr(self, 'tone_generators'):
@@ -198,6 +230,7 @@ class InteractiveUI:
     def toggle_statue(self):
         """Toggle the selected statue on/off."""
         self.tone_enabled[self.selected_index] = not self.tone_enabled[self.selected_index]
+        self.dirty = True
 
         # Update the audio playback if we have a reference to it
         if hasattr(self, 'playback'):
@@ -221,16 +254,17 @@ class InteractiveUI:
             else:
                 # Interactive mode
                 while self.running:
-                    self.draw_ui()
+                    # Redraw only when a key changed something
+                    if self.dirty:
+                        self.dirty = False
+                        self.draw_ui()
 
-                    # Non-blocking key input with timeout
-                    if sys.stdin in select.select([sys.stdin], [], [], 0.1)[0]:
+                    # Block until a key arrives (or a second passes)
+                    if sys.stdin in select.select([sys.stdin], [], [], 1.0)[0]:
                         key = sys.stdin.read(1)
                         if not handle_key_input(key, self):
                             self.running = False
 
-                    time.sleep(0.05)  # Small delay to reduce CPU usage
-
         finally:
             self.restore_terminal()
             self.show_cursor()
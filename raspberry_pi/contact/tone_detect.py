@@ -29,10 +29,13 @@ Detection Thresholds:
 - SNR typically > 30dB for reliable detection
 """
 
+import contextlib
+import math
+import queue
 import threading
 from typing import TYPE_CHECKING, Callable, Optional
 
-import fastgoertzel as G
+import numba
 import numpy as np
 import sounddevice as sd
 
@@ -42,6 +45,24 @@ if TYPE_CHECKING:
     from .display import StatusDisplay
     from .link_state import LinkStateTracker
 
+# Blocks of captured audio the detection loop may lag behind the input callback
+RING_BLOCKS = 8
+
+# Consecutive blocks integrated into one Goertzel window. Longer windows
+# raise tone SNR (~3 dB per doubling) and halve per-window overhead, at the
+# cost of one detection result per window instead of per block. Must divide
+# RING_BLOCKS so a window never wraps around the ring
+INTEGRATION_BLOCKS = 2
+
+# Furthest write_idx may run ahead of a window's last block while the window
+# is read. The callback writes block write_idx before counting it, so at
+# write_idx - idx == RING_BLOCKS - INTEGRATION_BLOCKS + 1 it may already be
+# overwriting the window's first row
+MAX_WINDOW_LAG = RING_BLOCKS - INTEGRATION_BLOCKS
+
+# Decibels per natural-log unit of a power ratio: 10*log10(r) == DB_PER_LN*ln(r)
+DB_PER_LN = 10.0 / math.log(10.0)
+
 
 def create_tone_generator(frequency: float, sample_rate: int) -> Callable[[int], np.ndarray]:
     """Create a tone generator closure for the given frequency.
@@ -59,7 +80,7 @@ def create_tone_generator(frequency: float, sample_rate: int) -> Callable[[int],
 
     Returns:
         function: A generator function that takes frame count and returns
-                 a numpy array of sine wave samples
+                 a numpy array of sine wave samples (reused between calls)
 
     Example:
         >>> gen = create_tone_generator(1000, 44100)
@@ -67,22 +88,100 @@ def create_tone_generator(frequency: float, sample_rate: int) -> Callable[[int],
         >>> samples.shape
         (1024,)
     """
-    phase = 0
+    # Rotate a unit phasor by one sample's angle per sample instead of
+    # evaluating sin: the block is phasor * rotation**n, and the phasor
+    # then advances by rotation**frames to stay continuous across blocks.
+    # The ramp and the work/output buffers are sized on the first call and
+    # reused while the block length stays the same, so a callback allocates
+    # nothing; the returned block is overwritten by the next call
+    rotation = np.exp(2j * np.pi * frequency / sample_rate)
+    phasor = 1 + 0j
+    ramp = np.ones(0, dtype=np.complex128)
+    rotated = np.empty(0, dtype=np.complex128)
+    tone = np.empty(0)
+    block_step = 1 + 0j
 
     def generate_tone(frames):
-        nonlocal phase
-        t = (np.arange(frames) + phase) / sample_rate
-        tone = 0.5 * np.sin(2 * np.pi * frequency * t)
-        # Update phase for continuity
-        phase = (phase + frames) % int(sample_rate / frequency)
+        nonlocal phasor, ramp, rotated, tone, block_step
+        if len(ramp) != frames:
+            ramp = rotation ** np.arange(frames)
+            rotated = np.empty(frames, dtype=np.complex128)
+            tone = np.empty(frames)
+            block_step = rotation ** frames
+        np.multiply(ramp, phasor, out=rotated)
+        np.multiply(rotated.imag, 0.5, out=tone)
+        # Advance and renormalize so rounding never lets the amplitude drift
+        phasor *= block_step
+        phasor /= abs(phasor)
         return tone
 
     return generate_tone
 
 
+# Signatures are pinned so the kernel is compiled (or loaded from cache) at
+# import rather than on the first audio block: float32 capture windows in
+# detect_tone, float64 scratch blocks in the transmission tests
+@numba.njit(['float64(float32[::1], float64[::1], float64[::1])',
+             'float64(float64[::1], float64[::1], float64[::1])'],
+            cache=True, fastmath=True, nogil=True)
+def goertzel_multi(x, coeffs, out):
+    """Run one Goertzel recurrence per target frequency in a single pass over x.
+
+    Each sample is read once and fed to every frequency's accumulator pair,
+    instead of re-reading the block once per frequency. The GIL is released
+    while it runs, so detection threads for different statues overlap.
+
+    Args:
+        x (np.ndarray): Block of audio samples
+        coeffs (np.ndarray): 2*cos(2*pi*k/N) for each target frequency's bin k
+        out (np.ndarray): Receives the amplitude (2*sqrt(power)/N) per frequency
+
+    Returns:
+        float: Mean power of the block (mean of x**2), accumulated in the
+            same pass
+    """
+    k_count = coeffs.shape[0]
+    s1 = np.zeros(k_count)
+    s2 = np.zeros(k_count)
+    energy = 0.0
+    for n in range(x.shape[0]):
+        v = x[n]
+        energy += v * v
+        for i in range(k_count):
+            s = v + coeffs[i] * s1[i] - s2[i]
+            s2[i] = s1[i]
+            s1[i] = s
+    scale = 2.0 / x.shape[0]
+    for i in range(k_count):
+        power = s1[i] * s1[i] + s2[i] * s2[i] - coeffs[i] * s1[i] * s2[i]
+        out[i] = scale * math.sqrt(max(power, 0.0))
+    return energy / x.shape[0]
+
+
+def goertzel_coeffs(freqs: list[float], sample_rate: int, block_size: int) -> np.ndarray:
+    """Compute goertzel_multi coefficients for a block size.
+
+    Frequencies are mapped to the bin k = floor(freq / sample_rate * N), the
+    same bin fastgoertzel evaluates.
+
+    Args:
+        freqs (list[float]): Target frequencies in Hz
+        sample_rate (int): Sample rate in Hz
+        block_size (int): Samples per block (N)
+
+    Returns:
+        np.ndarray: 2*cos(2*pi*k/N) for each frequency
+    """
+    bins = np.array([int(f / sample_rate * block_size) for f in freqs], dtype=np.float64)
+    return 2.0 * np.cos(2.0 * np.pi * bins / block_size)
+
+
 def detect_tone(statue: Statue, other_statues: list[Statue], link_tracker: 'LinkStateTracker',
                 status_display: Optional['StatusDisplay'] = None,
-                shutdown_event: Optional[threading.Event] = None) -> None:
+                shutdown_event: Optional[threading.Event] = None,
+                tone_freqs: Optional[np.ndarray] = None,
+                freq_generation: Optional[np.ndarray] = None,
+                ready: Optional[threading.Barrier] = None) -> None:
     """Detect tones from other statues using the Goertzel algorithm.
 
     This function runs in a separate thread for each statue, continuously
@@ -90,8 +189,9 @@ def detect_tone(statue: Statue, other_statues: list[Statue], link_tracker: 'Link
     is detected above the threshold, it updates the link state.
 
     The detection process:
-    1. Read audio samples from the input device
-    2. Apply Goertzel algorithm to detect each target frequency
+    1. Take audio blocks queued by the input stream callback
+    2. Apply Goertzel algorithm to detect each target frequency, over
+       windows of INTEGRATION_BLOCKS consecutive blocks
     3. Calculate signal-to-noise ratio (SNR) for reliability
     4. Update link state if detection threshold is crossed
     5. Update display metrics for visualization
@@ -102,6 +202,14 @@ def detect_tone(statue: Statue, other_statues: list[Statue], link_tracker: 'Link
         link_tracker (LinkStateTracker): Tracks connection states
         status_display (StatusDisplay, optional): Updates UI metrics
         shutdown_event (threading.Event, optional): Signals thread shutdown
+        tone_freqs (np.ndarray, optional): Tone frequency per statue in enum
+            order, updated in place while running (see FrequencyController).
+            If omitted, frequencies are polled from dynConfig every window
+        freq_generation (np.ndarray, optional): One-element counter bumped
+            after each tone_freqs write; required with tone_freqs
+        ready (threading.Barrier, optional): Waited on once the input stream
+            is running, so the caller can block until every detector is
+            listening. Aborted if this detector cannot start
 
     Note:
         This function runs indefinitely until shutdown_event is set or
@@ -111,25 +219,70 @@ def detect_tone(statue: Statue, other_statues: list[Statue], link_tracker: 'Link
 
     if config["device_index"] == -1:
         print(f"WARNING: No input device configured for {statue.value}")
+        if ready is not None:
+            ready.abort()
         return
 
     freqs = [dynConfig[s.value]["tone_freq"] for s in other_statues]
     if not link_tracker.quiet:
         print(f"{statue.value} listening for tones {freqs}Hz on device {config['device_index']}")
 
-    stream = sd.InputStream(
-        device=config["device_index"],
-        channels=1,  # Mono input
-        samplerate=config["sample_rate"],
-        blocksize=dynConfig["block_size"],
-    )
+    # Fixed for the run, so read once rather than per block
+    sample_rate = config["sample_rate"]
+    block_size = dynConfig["block_size"]
+    threshold = dynConfig["touch_threshold"]
+
+    # The input callback copies each float32 block straight into a
+    # preallocated ring and queues its sequence number for the loop below;
+    # the Goertzel kernel accumulates in float64, so no widening copy is needed
+    ring = np.zeros((RING_BLOCKS, block_size), dtype=np.float32)
+    filled: queue.SimpleQueue = queue.SimpleQueue()
+    write_idx = 0
+
+    def capture_callback(indata, frames, _time_info, status):
+        nonlocal write_idx
+        ring[write_idx % RING_BLOCKS] = indata[:, 0]
+        filled.put((write_idx, bool(status.input_overflow)))
+        write_idx += 1
+
+    # Track current detection state for each statue, bit i = other_statues[i]
+    state_mask = 0
+    bit_values = 1 << np.arange(len(other_statues), dtype=np.int64)
+
+    # Where retunes come from: the shared frequency array, checked through its
+    # generation counter, or else the per-statue config dicts updated in place
+    if tone_freqs is not None:
+        target_indices = [list(Statue).index(s) for s in other_statues]
+        seen_generation = int(freq_generation[0])
+        freqs = tone_freqs[target_indices].tolist()
+    else:
+        target_configs = [dynConfig[s.value] for s in other_statues]
+    # Goertzel coefficients and output, rebuilt only when a frequency changes
+    window_size = INTEGRATION_BLOCKS * block_size
+    coeffs = goertzel_coeffs(freqs, sample_rate, window_size)
+    levels = np.zeros(len(other_statues))
 
-    stream.start()
+    try:
+        stream = sd.InputStream(
+            device=config["device_index"],
+            channels=1,  # Mono input
+            samplerate=sample_rate,
+            blocksize=block_size,
+            dtype='float32',
+            latency='low',
+            callback=capture_callback,
+        )
+        stream.start()
+    except Exception:
+        if ready is not None:
+            ready.abort()
+        raise
     if not link_tracker.quiet:
         print(f"✓ Detection started for {statue.value}")
-
-    # Track current detection state for each statue
-    detection_state = {s: False for s in other_statues}
+    if ready is not None:
+        # If another detector failed the barrier is broken; keep listening
+        with contextlib.suppress(threading.BrokenBarrierError):
+            ready.wait()
 
     # Detect tones using the Goertzel algorithm
     while True:
@@ -138,40 +291,67 @@ def detect_tone(statue: Statue, other_statues: list[Statue], link_tracker: 'Link
             break
 
         try:
-            audio, overflowed = stream.read(dynConfig["block_size"])
+            try:
+                idx, overflowed = filled.get(timeout=0.1)
+            except queue.Empty:
+                continue
             if overflowed:
                 print("Input overflow!")
-
-            # Convert to float64 for Goertzel
-            audio_data = audio[:, 0].astype(np.float64)
-
-            # Calculate overall signal power for noise estimation
-            total_power = np.mean(audio_data ** 2)
-
-            # Check for each other statue's tone
-            for s in other_statues:
-                freq = dynConfig[s.value]["tone_freq"]
-                normalized_freq = freq / config["sample_rate"]
-                level, _ = G.goertzel(audio_data, normalized_freq)
-
-                # Simple SNR calculation
-                if total_power > 0:
-                    snr_db = 10 * np.log10(level / total_power) if level > 0 else -20
-                else:
-                    snr_db = 0
-
-                # Update status display if available
-                if status_display:
+            if (idx + 1) % INTEGRATION_BLOCKS:
+                # Window not complete yet
+                continue
+            if write_idx - idx > MAX_WINDOW_LAG:
+                # The callback is already reusing the window's first slot
+                continue
+
+            # The window's blocks sit in adjacent ring rows, so this is a view
+            start = (idx + 1 - INTEGRATION_BLOCKS) % RING_BLOCKS
+            audio_data = ring[start:start + INTEGRATION_BLOCKS].reshape(-1)
+
+            # Frequencies can be retuned while running (e.g. by the demo's
+            # frequency controller), so pick up any change before detecting
+            if tone_freqs is not None:
+                if freq_generation[0] != seen_generation:
+                    seen_generation = int(freq_generation[0])
+                    freqs = tone_freqs[target_indices].tolist()
+                    coeffs = goertzel_coeffs(freqs, sample_rate, window_size)
+            else:
+                current_freqs = [target["tone_freq"] for target in target_configs]
+                if current_freqs != freqs:
+                    freqs = current_freqs
+                    coeffs = goertzel_coeffs(freqs, sample_rate, window_size)
+
+            # All target frequencies in one pass over the block; the overall
+            # signal power for noise estimation comes out of the same pass
+            total_power = goertzel_multi(audio_data, coeffs, levels)
+            if write_idx - idx > MAX_WINDOW_LAG:
+                # The callback caught up during the pass and may have
+                # overwritten the window under the kernel; drop the result
+                continue
+
+            # Update status display if available
+            if status_display:
+                for s, level in zip(other_statues, levels.tolist()):
+                    # Simple SNR calculation, on plain floats
+                    if total_power > 0:
+                        snr_db = DB_PER_LN * math.log(level / total_power) if level > 0 else -20
+                    else:
+                        snr_db = 0
                     status_display.update_metrics(statue, s, level, snr_db)
 
-                # Determine if currently detected
-                currently_detected = level > dynConfig["touch_threshold"]
+            # Determine which tones are currently detected, one bit per statue
+            new_mask = int(np.dot(levels > threshold, bit_values))
 
-                # Check if state changed
-                if currently_detected != detection_state[s]:
-                    detection_state[s] = currently_detected
+            # Notify only the statues whose state changed; usually none did
+            diff = new_mask ^ state_mask
+            if diff:
+                state_mask = new_mask
+                while diff:
+                    low = diff & -diff
                     # Update link tracker (handles printing)
-                    link_tracker.update_link(statue, s, currently_detected)
+                    link_tracker.update_link(statue, other_statues[low.bit_length() - 1],
+                                             bool(new_mask & low))
+                    diff ^= low
 
         except KeyboardInterrupt:
             break
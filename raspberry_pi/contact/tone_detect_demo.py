@@ -1,6 +1,6 @@
 #!/usr/bin/env -S uv run --script
 # /// script
-# dependencies = ["fastgoertzel", "numpy", "sounddevice", "soundfile"]
+# dependencies = ["numba", "numpy", "sounddevice", "soundfile"]
 # ///
 
 """Missing Link Tone Detection Demo
@@ -9,7 +9,9 @@ This script demonstrates the tone-based contact detection system,
 showing real-time connection status and audio playback control.
 """
 
-import select
+import os
+import queue
+import re
 import sys
 import termios
 import threading
@@ -17,6 +19,8 @@ import time
 import tty
 from typing import Any, Optional
 
+import numpy as np
+
 from audio.devices import Statue, configure_devices, dynConfig
 
 # Import from our contact module
@@ -35,6 +39,9 @@ try:
 except ImportError:
     HAS_TX_CONTROL = False
 
+# Seconds to wait for every detector's input stream to start
+DETECTOR_START_TIMEOUT = 5.0
+
 
 class FrequencyController:
     """Manages dynamic frequency updates for tone generation and detection."""
@@ -53,18 +60,35 @@ class FrequencyController:
         self.lock = threading.RLock()
         self.tx_controller = tx_controller
 
-        # Initialize current frequencies from tone generators
+        # Initialize current frequencies from tone generators. Writers hold
+        # the lock; readers (the display, every frame) don't need it, since a
+        # single dict/set lookup or int read is atomic under the GIL
         self.current_frequencies = {}
         self.muted_statues = set()  # Track muted statues
         for statue, generator in dynamic_tone_generators.items():
             self.current_frequencies[statue] = generator.get_frequency()
 
+        # Tone frequency per statue (enum order) shared with the detection
+        # threads; each write is followed by a freq_generation bump so they
+        # can spot retunes without touching dynConfig or this lock
+        self.statue_index = {statue: i for i, statue in enumerate(Statue)}
+        self.tone_freqs = np.zeros(len(self.statue_index))
+        for statue in self.statue_index:
+            self.tone_freqs[self.statue_index[statue]] = dynConfig[statue.value].get("tone_freq", 0)
+        self.freq_generation = np.zeros(1, dtype=np.int64)
+
+    def _publish_frequency(self, statue, freq):
+        """Make a statue's detection frequency visible to the detection threads."""
+        dynConfig[statue.value]["tone_freq"] = freq
+        self.tone_freqs[self.statue_index[statue]] = freq
+        self.freq_generation[0] += 1
+
     def get_selected_statue(self):
         """Get currently selected statue."""
-        with self.lock:
-            if 0 <= self.selected_statue_index < len(self.devices):
-                return self.devices[self.selected_statue_index]['statue']
-            return None
+        index = self.selected_statue_index  # Read once, lock-free
+        if 0 <= index < len(self.devices):
+            return self.devices[index]['statue']
+        return None
 
     def navigate_up(self):
         """Move selection up to previous statue."""
@@ -93,13 +117,12 @@ class FrequencyController:
                 self.dynamic_tone_generators[selected_statue].set_frequency(new_freq)
                 self.current_frequencies[selected_statue] = new_freq
 
-                # Update detection frequencies in dynConfig (affects detection threads)
-                dynConfig[selected_statue.value]["tone_freq"] = new_freq
+                # Update detection frequencies (affects detection threads)
+                self._publish_frequency(selected_statue, new_freq)
 
     def get_current_frequency(self, statue):
         """Get current frequency for a statue."""
-        with self.lock:
-            return self.current_frequencies.get(statue, 0)
+        return self.current_frequencies.get(statue, 0)
 
     def toggle_mute(self):
         """Toggle mute state for selected statue."""
@@ -112,7 +135,7 @@ class FrequencyController:
                 # Unmute: restore frequency and enable TX
                 self.muted_statues.remove(selected_statue)
                 self.dynamic_tone_generators[selected_statue].set_frequency(self.current_frequencies[selected_statue])
-                dynConfig[selected_statue.value]["tone_freq"] = self.current_frequencies[selected_statue]
+                self._publish_frequency(selected_statue, self.current_frequencies[selected_statue])
                 
                 # Enable TX if controller available
                 if self.tx_controller:
@@ -121,7 +144,7 @@ class FrequencyController:
                 # Mute: set frequency to 0 and disable TX
                 self.muted_statues.add(selected_statue)
                 self.dynamic_tone_generators[selected_statue].set_frequency(0)
-                dynConfig[selected_statue.value]["tone_freq"] = 0
+                self._publish_frequency(selected_statue, 0)
                 
                 # Disable TX if controller available
                 if self.tx_controller:
@@ -129,37 +152,66 @@ class FrequencyController:
 
     def is_muted(self, statue):
         """Check if a statue is muted."""
-        with self.lock:
-            return statue in self.muted_statues
+        return statue in self.muted_statues
+
+
+# Key -> (FrequencyController method, args); None marks the exit keys
+_KEY_ACTIONS = {
+    'q': None, 'Q': None, '\x1b': None,  # Q or ESC - exit
+    'w': ('adjust_frequency', (+500,)), 'W': ('adjust_frequency', (+500,)),  # Up - increase frequency
+    's': ('adjust_frequency', (-500,)), 'S': ('adjust_frequency', (-500,)),  # Down - decrease frequency
+    'a': ('navigate_up', ()), 'A': ('navigate_up', ()),  # Left - previous statue
+    'd': ('navigate_down', ()), 'D': ('navigate_down', ()),  # Right - next statue
+    ' ': ('toggle_mute', ()),  # Spacebar - toggle mute
+    '\x1b[A': ('adjust_frequency', (+500,)),  # Up arrow
+    '\x1b[B': ('adjust_frequency', (-500,)),  # Down arrow
+    '\x1b[D': ('navigate_up', ()),  # Left arrow
+    '\x1b[C': ('navigate_down', ()),  # Right arrow
+}
+
+# Splits a raw stdin chunk into arrow-key escape sequences and single keys
+_KEY_TOKEN = re.compile(r'\x1b\[[A-D]|.', re.DOTALL)
 
 
 def handle_key_input(key, freq_controller):
     """Handle keyboard input for frequency control."""
-    if key == 'q' or key == 'Q' or key == '\x1b':  # ESC key
+    if key not in _KEY_ACTIONS:
+        return True  # Unbound key, continue running
+    action = _KEY_ACTIONS[key]
+    if action is None:
         return False  # Signal to exit
-    elif key == 'w' or key == 'W':  # Up - increase frequency
-        freq_controller.adjust_frequency(+500)
-    elif key == 's' or key == 'S':  # Down - decrease frequency
-        freq_controller.adjust_frequency(-500)
-    elif key == 'a' or key == 'A':  # Left - previous statue
-        freq_controller.navigate_up()
-    elif key == 'd' or key == 'D':  # Right - next statue
-        freq_controller.navigate_down()
-    elif key == ' ':  # Spacebar - toggle mute
-        freq_controller.toggle_mute()
+    method, args = action
+    getattr(freq_controller, method)(*args)
     return True  # Continue running
 
 
+def keyboard_reader(key_queue: queue.Queue) -> None:
+    """Forward each key read from stdin to key_queue; run in a daemon thread.
+
+    The blocking read lets the main loop sleep on the queue instead of
+    polling stdin. Reading raw chunks delivers an arrow key's whole escape
+    sequence in one read, so it can be queued as a single key.
+    """
+    fd = sys.stdin.fileno()
+    while True:
+        chunk = os.read(fd, 16)
+        if not chunk:
+            break  # stdin closed
+        for key in _KEY_TOKEN.findall(chunk.decode('latin-1')):
+            key_queue.put(key)
+
+
 def play_and_detect_tones(devices: list[dict[str, Any]], link_tracker: LinkStateTracker,
                           status_display: Optional[StatusDisplay] = None,
-                          shutdown_event: Optional[threading.Event] = None) -> list[threading.Thread]:
+                          shutdown_event: Optional[threading.Event] = None,
+                          freq_controller: Optional[FrequencyController] = None) -> list[threading.Thread]:
     """
     Start tone generation and detection for all configured statues.
     Each statue plays its unique tone and detects all other statue tones.
     """
     if not link_tracker.quiet:
-        print("\nStarting tone generation and detection...")
-        print(f"Configured statues: {[dev['statue'].value for dev in devices]}")
+        print("\nStarting tone generation and detection...\n"
+              f"Configured statues: {[dev['statue'].value for dev in devices]}")
 
     # Get list of configured statues
     configured_statues = [dev['statue'] for dev in devices]
@@ -168,35 +220,45 @@ def play_and_detect_tones(devices: list[dict[str, Any]], link_tracker: LinkState
     if not link_tracker.quiet:
         print("\nTone generators integrated with audio playback")
 
-    # Small delay to ensure all tones are playing
-    time.sleep(0.5)
-
     # Start detection threads for statues with input capability
     if not link_tracker.quiet:
         print("\nStarting detection threads:")
     detection_threads = []
+    # Shared frequency array so detection follows live retunes without dict lookups
+    freq_args = ((freq_controller.tone_freqs, freq_controller.freq_generation)
+                 if freq_controller else ())
+
+    # Statues with input capability, each detecting all other statues
+    detectors = [(statue, [s for s in configured_statues if s != statue])
+                 for statue in configured_statues
+                 if dynConfig[statue.value]["detect"]["device_index"] != -1
+                 and len(configured_statues) > 1]
+
+    # Released once every detector's input stream is running
+    ready = threading.Barrier(len(detectors) + 1)
+
+    for statue, other_statues in detectors:
+        thread = threading.Thread(
+            target=detect_tone,
+            args=(statue, other_statues, link_tracker, status_display, shutdown_event,
+                  *freq_args),
+            kwargs={'ready': ready},
+            daemon=True,
+            name=f"detect_{statue.value}"
+        )
+        detection_threads.append(thread)
+        thread.start()
 
-    for statue in configured_statues:
-        if dynConfig[statue.value]["detect"]["device_index"] != -1:
-            # Each statue detects all other statues
-            other_statues = [s for s in configured_statues if s != statue]
-            if other_statues:
-                thread = threading.Thread(
-                    target=detect_tone,
-                    args=(statue, other_statues, link_tracker, status_display, shutdown_event),
-                    daemon=True,
-                    name=f"detect_{statue.value}"
-                )
-                detection_threads.append(thread)
-                thread.start()
+    try:
+        ready.wait(timeout=DETECTOR_START_TIMEOUT)
+    except threading.BrokenBarrierError:
+        print("WARNING: Not all detection threads started listening")
 
     if not link_tracker.quiet:
-        print(f"\n{len(detection_threads)} detection thread(s) started")
-        print("\nMonitoring for connections... Press Ctrl+C to stop")
-
-        # Print initial status
-        time.sleep(1)
-        print("\n" + link_tracker.get_link_summary())
+        # Thread count, hint and initial status in one write
+        print(f"\n{len(detection_threads)} detection thread(s) started\n"
+              "\nMonitoring for connections... Press Ctrl+C to stop\n"
+              "\n" + link_tracker.get_link_summary())
 
     return detection_threads
 
@@ -251,12 +313,13 @@ def main() -> int:
             dynConfig[statue.value]["tone_freq"] = TONE_FREQUENCIES[statue]
 
     if dynConfig["debug"]:
-        print("\nTone frequencies configured:")
+        lines = ["\nTone frequencies configured:"]
         for device in devices:
             statue = device['statue']
             freq = dynConfig[statue.value].get('tone_freq', -1)
             if freq > 0:
-                print(f"  {statue.value.upper()}: {freq}Hz")
+                lines.append(f"  {statue.value.upper()}: {freq}Hz")
+        print("\n".join(lines))
 
     # Initialize audio playback with dynamic tone generators
     audio_playback, dynamic_tone_generators = initialize_audio_playback(devices)
@@ -293,35 +356,51 @@ def main() -> int:
     display_thread = threading.Thread(target=status_display.run, daemon=True)
     display_thread.start()
 
-    detection_threads = play_and_detect_tones(devices, link_tracker, status_display, shutdown_event)
+    detection_threads = play_and_detect_tones(devices, link_tracker, status_display, shutdown_event,
+                                              freq_controller)
 
     # Set up terminal for non-blocking input
     old_settings = termios.tcgetattr(sys.stdin)
     try:
         tty.setraw(sys.stdin.fileno())
 
-        print("\n=== Interactive Controls ===")
-        print("A/D: Navigate statues | W/S: Adjust frequency (+/-500Hz) | Space: Mute/Unmute | Q/ESC: Quit")
+        # Raw mode doesn't translate \n, so lines end in \r\n; one write for all
+        lines = ["", "=== Interactive Controls ===",
+                 "A/D/←/→: Navigate statues | W/S/↑/↓: Adjust frequency (+/-500Hz) | Space: Mute/Unmute | Q/ESC: Quit"]
         if tx_controller:
-            print("TX switching: ENABLED (mute will disconnect TX)")
-        print("Currently controlling frequencies in real-time...")
-
-        start_time = time.time()
+            lines.append("TX switching: ENABLED (mute will disconnect TX)")
+        lines.append("Currently controlling frequencies in real-time...")
+        sys.stdout.write("\r\n".join(lines) + "\r\n")
+        sys.stdout.flush()
+
+        # Keys arrive from a reader thread; the loop sleeps until one does
+        key_queue: queue.Queue = queue.Queue()
+        threading.Thread(target=keyboard_reader, args=(key_queue,), daemon=True,
+                         name="keyboard").start()
+
+        # Monotonic integer deadline: immune to wall-clock (NTP) steps
+        deadline_ns = time.monotonic_ns() + args.timeout * 1_000_000_000 if args.timeout > 0 else None
         while True:
-            # Check for keyboard input (non-blocking)
-            if select.select([sys.stdin], [], [], 0.1)[0]:
-                key = sys.stdin.read(1)
-                if not handle_key_input(key, freq_controller):
-                    print("\nExiting due to user input...")
+            # Wait for the next key, or only as long as the timeout allows
+            remaining = None
+            if deadline_ns is not None:
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                if remaining_ns <= 0:
+                    sys.stdout.write("\r\nTimeout reached, shutting down...\r\n")
                     break
+                remaining = remaining_ns / 1e9
+
+            try:
+                key = key_queue.get(timeout=remaining)
+            except queue.Empty:
+                continue  # Timeout check at the top of the loop
 
-            # Check timeout
-            if args.timeout > 0 and (time.time() - start_time) >= args.timeout:
-                print("\nTimeout reached, shutting down...")
+            if not handle_key_input(key, freq_controller):
+                sys.stdout.write("\r\nExiting due to user input...\r\n")
                 break
 
     except KeyboardInterrupt:
-        print("\nInterrupted by user...")
+        sys.stdout.write("\r\nInterrupted by user...\r\n")
     finally:
         # Restore terminal settings
         termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
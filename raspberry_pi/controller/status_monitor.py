@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # dependencies = [
-#   "backports.strenum", "paho-mqtt", "ultraimport", "sounddevice"
+#   "backports.strenum", "numpy", "paho-mqtt", "ultraimport", "sounddevice"
 # ]
 # ///
 """